@@ -1,5 +1,6 @@
 """Dialog agent - primary user-facing conversation handler with persona."""
 
+import asyncio
 import re
 from datetime import datetime
 from pathlib import Path
@@ -137,6 +138,10 @@ class DialogAgent(BaseAgent):
         self._conversation_log = conversation_log
         self._conversation_log_owned = conversation_log is None
 
+        # Exchanges are persisted in the background, one at a time in arrival order
+        self._persist_lock = asyncio.Lock()
+        self._pending_writes: set[asyncio.Task[None]] = set()
+
     async def initialize(self) -> None:
         """Load identity, agenda, user profile, and conversation log."""
         await super().initialize()
@@ -380,7 +385,10 @@ class DialogAgent(BaseAgent):
             )
 
         self.context.conversation.append(response_msg)
-        await self._persist_exchange(message, response_msg)
+        # Keep disk I/O off the reply path; flush_pending_writes() waits for it
+        task = asyncio.create_task(self._persist_exchange_serialized(message, response_msg))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
 
         self.state = AgentState.READY
         return response_msg
@@ -456,6 +464,16 @@ class DialogAgent(BaseAgent):
 
         return min(1.0, max(0.0, score))
 
+    async def flush_pending_writes(self) -> None:
+        """Wait for background exchange writes to complete."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes)
+
+    async def _persist_exchange_serialized(self, user_msg: Message, assistant_msg: Message) -> None:
+        """Persist one exchange, waiting for earlier writes to finish first."""
+        async with self._persist_lock:
+            await self._persist_exchange(user_msg, assistant_msg)
+
     async def _persist_exchange(self, user_msg: Message, assistant_msg: Message) -> None:
         """Save conversation exchange to episodic memory and conversation log."""
         # Log to conversation log for migration support
@@ -546,6 +564,8 @@ class DialogAgent(BaseAgent):
 
     async def summarize_session(self) -> str | None:
         """Summarize and persist conversation, returns summary text."""
+        await self.flush_pending_writes()
+
         if len(self.context.conversation) < 2:
             # Still end the conversation log session even if no summary
             if self._conversation_log:
@@ -598,6 +618,7 @@ class DialogAgent(BaseAgent):
 
     async def close(self) -> None:
         """Close agent and conversation log."""
+        await self.flush_pending_writes()
         if self._conversation_log and self._conversation_log_owned:
             await self._conversation_log.close()
             self._conversation_log = None
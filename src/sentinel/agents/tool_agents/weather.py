@@ -1,6 +1,8 @@
 """Weather agent - provides weather information via wttr.in API."""
 
 import json
+import time
+from collections import OrderedDict
 from typing import Any, cast
 
 import httpx
@@ -37,6 +39,9 @@ Forecast: {forecast}
 
 Summary:"""
 
+CACHE_TTL_SECONDS = 3600.0
+CACHE_MAX_ENTRIES = 1024
+
 
 class WeatherAgent(ToolAgent):
     """Agent that provides weather information using wttr.in API."""
@@ -48,6 +53,8 @@ class WeatherAgent(ToolAgent):
         super().__init__(llm)
         self._api_base = "https://wttr.in"
         self._timeout = 10.0
+        # Summaries keyed by normalized location: (created_at monotonic, summary), LRU order
+        self._cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
 
     async def execute_task(self, task: str, global_context: dict[str, Any]) -> str:
         """Execute weather query.
@@ -65,14 +72,42 @@ class WeatherAgent(ToolAgent):
         location = await self._extract_location(task, global_context)
         logger.debug(f"Extracted location: {location}")
 
+        # Paraphrased requests ("Tokyo weather", "will it rain in Tokyo") resolve to the
+        # same location, so the cache skips the fetch + summarize round-trip for them
+        cache_key = " ".join(location.lower().split())
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug(f"Weather cache hit: {cache_key}")
+            return cached
+
         # Step 2: Fetch weather data
         weather_data = await self._fetch_weather(location)
 
         # Step 3: Summarize for user
         summary = await self._summarize_weather(location, weather_data)
 
+        self._cache_put(cache_key, summary)
         return summary
 
+    def _cache_get(self, key: str) -> str | None:
+        """Return cached summary if present and fresh."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        created_at, summary = entry
+        if time.monotonic() - created_at > CACHE_TTL_SECONDS:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return summary
+
+    def _cache_put(self, key: str, summary: str) -> None:
+        """Store summary, evicting least recently used entries past capacity."""
+        self._cache[key] = (time.monotonic(), summary)
+        self._cache.move_to_end(key)
+        while len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
     async def _extract_location(self, task: str, global_context: dict[str, Any]) -> str:
         """Use LLM to extract location from natural language request."""
         user_location = "unknown"
@@ -12,9 +12,13 @@ Flags:
 """
 
 import asyncio
+import codecs
 import logging
+import os
 import signal
 import sys
+import threading
+from collections.abc import Callable
 from datetime import datetime
 from uuid import uuid4
 
@@ -57,11 +61,11 @@ def main() -> int:
 
     if command == "chat":
         logger.info("Starting CLI chat mode")
-        return asyncio.run(_chat_loop(settings))
+        return asyncio.run(_chat_loop(settings), loop_factory=_loop_factory(settings))
 
     if command == "run":
         logger.info("Starting Telegram bot")
-        return asyncio.run(_run_telegram(settings))
+        return asyncio.run(_run_telegram(settings), loop_factory=_loop_factory(settings))
 
     if command == "health":
         return asyncio.run(_health_check(settings))
@@ -70,6 +74,20 @@ def main() -> int:
     return 1
 
 
+def _loop_factory(settings: Settings) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Resolve event loop factory from settings (None = asyncio default)."""
+    if settings.fast_loop == "uvloop":
+        try:
+            import uvloop
+        except ImportError:
+            get_logger("cli").warning("uvloop not installed, using default event loop")
+            return None
+        get_logger("cli").info("Using uvloop event loop")
+        factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+        return factory
+    return None
+
+
 async def _run_telegram(settings: Settings) -> int:
     """Run Telegram bot."""
     from sentinel.interfaces.telegram import TelegramInterface
@@ -77,24 +95,31 @@ async def _run_telegram(settings: Settings) -> int:
     interface = TelegramInterface()
     logger = get_logger("cli.telegram")
 
-    # Set up signal handlers for graceful shutdown
-    def handle_shutdown_signal(signum: int, frame: object | None) -> None:
+    # Signals are delivered through the event loop, so the wait below wakes immediately
+    loop = asyncio.get_running_loop()
+
+    def handle_shutdown_signal(sig: signal.Signals) -> None:
         """Handle shutdown signals."""
-        sig_name = signal.Signals(signum).name
-        logger.info(f"Received {sig_name}, initiating graceful shutdown")
+        logger.info(f"Received {sig.name}, initiating graceful shutdown")
         interface._shutdown_event.set()
 
-    # Register signal handlers
-    signal.signal(signal.SIGINT, handle_shutdown_signal)
-    signal.signal(signal.SIGTERM, handle_shutdown_signal)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, handle_shutdown_signal, sig)
+        except NotImplementedError:  # Windows event loops
+            signal.signal(
+                sig,
+                lambda signum, frame: loop.call_soon_threadsafe(
+                    handle_shutdown_signal, signal.Signals(signum)
+                ),
+            )
 
     try:
         await interface.start()
         print("Telegram bot running. Press Ctrl+C to stop or use /kill command.")
 
         # Keep running until shutdown signal received
-        while not interface._shutdown_event.is_set():
-            await asyncio.sleep(0.5)
+        await interface._shutdown_event.wait()
 
         logger.info("Shutdown signal received, stopping bot")
         print("\nShutting down gracefully...")
@@ -108,6 +133,55 @@ async def _run_telegram(settings: Settings) -> int:
     return 0
 
 
+def _start_stdin_reader() -> asyncio.Queue[str | None]:
+    """Deliver stdin lines through a queue (None = EOF) without blocking the event loop.
+
+    On POSIX the loop watches the stdin fd, so nothing is left blocked in input() when
+    Ctrl+C stops the loop. Loops without add_reader (Windows proactor) and non-pollable
+    stdin (a redirected regular file) fall back to a daemon reader thread.
+    """
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue[str | None] = asyncio.Queue()
+    fd = sys.stdin.fileno()
+    decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")(errors="replace")
+    pending = ""
+
+    def on_readable() -> None:
+        nonlocal pending
+        data = os.read(fd, 4096)
+        if not data:  # EOF
+            loop.remove_reader(fd)
+            if pending:
+                lines.put_nowait(pending)
+            lines.put_nowait(None)
+            return
+        *complete, pending = (pending + decoder.decode(data)).split("\n")
+        for line in complete:
+            lines.put_nowait(line)
+
+    try:
+        loop.add_reader(fd, on_readable)
+        return lines
+    except (NotImplementedError, OSError):
+        pass
+
+    def pump() -> None:
+        while True:
+            try:
+                line: str | None = input()
+            except (EOFError, OSError):
+                line = None
+            try:
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+            except RuntimeError:  # Loop already closed
+                return
+            if line is None:
+                return
+
+    threading.Thread(target=pump, name="stdin-reader", daemon=True).start()
+    return lines
+
+
 async def _chat_loop(settings: Settings) -> int:
     """Interactive CLI chat with dialog agent."""
     from sentinel.agents.dialog import DialogAgent
@@ -145,12 +219,16 @@ async def _chat_loop(settings: Settings) -> int:
 
     print("Ready.\n")
 
+    # Read without blocking the loop so background tasks keep running while typing
+    lines = _start_stdin_reader()
+
     try:
         while True:
-            try:
-                user_input = input("> ").strip()
-            except EOFError:
+            print("> ", end="", flush=True)
+            line = await lines.get()
+            if line is None:  # EOF
                 break
+            user_input = line.strip()
 
             if not user_input:
                 continue
@@ -187,7 +265,8 @@ async def _chat_loop(settings: Settings) -> int:
             except Exception as e:
                 print(f"Error: {e}\n")
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # asyncio.run delivers Ctrl+C as cancellation of this task
         print("\n\nShutting down...")
     finally:
         # Summarize session before closing if there's conversation history
@@ -6,6 +6,7 @@ Prefix: SENTINEL_
 """
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,6 +30,23 @@ class Settings(BaseSettings):
     # Telegram
     telegram_token: str = Field(default="", description="Telegram bot token")
     telegram_owner_id: int = Field(default=0, description="Owner's Telegram user ID")
+    telegram_max_inflight: int = Field(
+        default=4, description="Max concurrent LLM requests from Telegram handlers"
+    )
+    telegram_webhook_url: str = Field(
+        default="",
+        description="Public HTTPS base URL for webhook mode (empty = long polling)",
+    )
+    telegram_webhook_listen: str = Field(default="0.0.0.0", description="Webhook bind address")
+    telegram_webhook_port: int = Field(default=8443, description="Webhook bind port")
+    telegram_webhook_secret: str = Field(
+        default="",
+        description="Secret token Telegram sends with webhook requests (empty = random per run)",
+    )
+    telegram_rate_limit: bool = Field(
+        default=False,
+        description="Pace outbound sends under Telegram flood limits (needs 'rate-limit' extra)",
+    )
 
     # External APIs
     brave_search_api_key: str = Field(default="", description="Brave Search API key")
@@ -67,6 +85,12 @@ class Settings(BaseSettings):
         description="Downgrade model difficulty at this % of budget (0.0-1.0)",
     )
 
+    # Runtime
+    fast_loop: Literal["default", "uvloop"] = Field(
+        default="default",
+        description="Event loop implementation: default | uvloop (needs 'fast-loop' extra)",
+    )
+
     # Workspace settings
     workspace_dir: Path = Field(
         default=Path("data/workspace"),
@@ -2,9 +2,14 @@
 
 import asyncio
 import contextlib
+import functools
+import heapq
+import inspect
+import itertools
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import timedelta
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -16,6 +21,9 @@ if TYPE_CHECKING:
 
 logger = get_logger("core.orchestrator")
 
+# How often a disabled one-shot task is re-checked (seconds); it runs once re-enabled
+DISABLED_RECHECK_INTERVAL = 60.0
+
 
 class TaskPriority(Enum):
     LOW = 1
@@ -23,19 +31,23 @@ class TaskPriority(Enum):
     HIGH = 3
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ScheduledTask:
-    """A task scheduled for background execution."""
+    """A task scheduled for background execution.
+
+    Times are time.monotonic() seconds; interval is in seconds.
+    """
 
     id: str
     name: str
     callback: Callable[[], Awaitable[None] | None]
-    interval: timedelta | None = None  # None = one-shot
+    interval: float | None = None  # None = one-shot
     priority: TaskPriority = TaskPriority.NORMAL
-    next_run: datetime = field(default_factory=datetime.now)
-    last_run: datetime | None = None
+    next_run: float = field(default_factory=time.monotonic)
+    last_run: float | None = None
     enabled: bool = True
     running: bool = False
+    is_coro: bool = False  # callback is an async function (sniffed once at schedule time)
 
 
 class Orchestrator:
@@ -43,29 +55,43 @@ class Orchestrator:
 
     def __init__(self) -> None:
         self._agents: dict[str, BaseAgent] = {}
+        self._agents_by_type: dict[AgentType, BaseAgent] = {}  # First registered per type
         self._tasks: dict[str, ScheduledTask] = {}
+        # Min-heap of (next_run, -priority, seq, task); seq breaks ties so
+        # tasks themselves are never compared. Stale entries are skipped lazily.
+        self._heap: list[tuple[float, int, int, ScheduledTask]] = []
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()  # Set when the schedule changes
         self._running = False
         self._scheduler_task: asyncio.Task[None] | None = None
-        self._idle_threshold = timedelta(minutes=5)
-        self._last_activity: datetime = datetime.now()
+        self._idle_threshold = 300.0  # seconds
+        self._last_activity = time.monotonic()
 
     def register_agent(self, agent_id: str, agent: "BaseAgent") -> None:
         """Register an agent with the orchestrator."""
+        if agent_id in self._agents:
+            self.unregister_agent(agent_id)
         self._agents[agent_id] = agent
+        self._agents_by_type.setdefault(agent.config.agent_type, agent)
         logger.debug(f"Registered agent: {agent_id}")
 
     def unregister_agent(self, agent_id: str) -> None:
         """Unregister an agent."""
-        if agent_id in self._agents:
-            del self._agents[agent_id]
+        agent = self._agents.pop(agent_id, None)
+        if agent is not None:
+            agent_type = agent.config.agent_type
+            if self._agents_by_type.get(agent_type) is agent:
+                del self._agents_by_type[agent_type]
+                # Fall back to the next registered agent of the same type, if any
+                for other in self._agents.values():
+                    if other.config.agent_type is agent_type:
+                        self._agents_by_type[agent_type] = other
+                        break
             logger.debug(f"Unregistered agent: {agent_id}")
 
     def get_agent(self, agent_type: AgentType) -> "BaseAgent | None":
         """Get agent by type."""
-        for agent in self._agents.values():
-            if agent.config.agent_type == agent_type:
-                return agent
-        return None
+        return self._agents_by_type.get(agent_type)
 
     def schedule_task(
         self,
@@ -77,34 +103,63 @@ class Orchestrator:
         delay: timedelta | None = None,
     ) -> None:
         """Schedule a background task."""
-        next_run = datetime.now()
+        next_run = time.monotonic()
         if delay:
-            next_run += delay
+            next_run += delay.total_seconds()
 
-        self._tasks[task_id] = ScheduledTask(
+        task = ScheduledTask(
             id=task_id,
             name=name,
             callback=callback,
-            interval=interval,
+            interval=interval.total_seconds() if interval else None,
             priority=priority,
             next_run=next_run,
+            is_coro=inspect.iscoroutinefunction(callback),
         )
+        self._tasks[task_id] = task
+        self._push(task)
+        self._wake.set()
         logger.info(f"Scheduled task: {name} (interval: {interval})")
 
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a scheduled task."""
         if task_id in self._tasks:
             del self._tasks[task_id]
+            self._wake.set()
             return True
         return False
 
+    def _push(self, task: ScheduledTask) -> None:
+        """Queue task's next run on the heap."""
+        entry = (task.next_run, -task.priority.value, next(self._seq), task)
+        heapq.heappush(self._heap, entry)
+
+    def _pop_due(self, now: float) -> list[ScheduledTask]:
+        """Pop tasks whose next_run has passed, highest priority first."""
+        due: list[ScheduledTask] = []
+        while self._heap and self._heap[0][0] <= now:
+            ts, _, _, task = heapq.heappop(self._heap)
+            # Skip entries for cancelled or rescheduled tasks
+            if self._tasks.get(task.id) is not task or task.next_run != ts:
+                continue
+            if not task.enabled:
+                # Skip this occurrence; periodic tasks get their next slot, one-shot
+                # tasks are parked and re-checked so they still run once re-enabled
+                task.next_run += task.interval or DISABLED_RECHECK_INTERVAL
+                self._push(task)
+                continue
+            due.append(task)
+        # Sort by priority (higher first)
+        due.sort(key=lambda t: t.priority.value, reverse=True)
+        return due
+
     def mark_activity(self) -> None:
         """Mark user activity (resets idle timer)."""
-        self._last_activity = datetime.now()
+        self._last_activity = time.monotonic()
 
     def is_idle(self) -> bool:
         """Check if system has been idle past threshold."""
-        return datetime.now() - self._last_activity > self._idle_threshold
+        return time.monotonic() - self._last_activity > self._idle_threshold
 
     async def start(self) -> None:
         """Start the orchestrator scheduler."""
@@ -126,44 +181,48 @@ class Orchestrator:
     async def _scheduler_loop(self) -> None:
         """Main scheduler loop - runs pending tasks."""
         while self._running:
-            now = datetime.now()
-            pending = [
-                t for t in self._tasks.values() if t.enabled and not t.running and t.next_run <= now
-            ]
-
-            # Sort by priority (higher first)
-            pending.sort(key=lambda t: t.priority.value, reverse=True)
-
-            for task in pending:
-                task.running = True
-                logger.debug(f"Running task: {task.name} (priority: {task.priority.value})")
-                try:
-                    result = task.callback()
-                    if asyncio.iscoroutine(result):
-                        await result
-                    logger.debug(f"Task completed: {task.name}")
-                except Exception as e:
-                    logger.error(f"Task {task.name} failed: {e}", exc_info=True)
-                finally:
-                    task.running = False
-                    task.last_run = datetime.now()
-
-                    if task.interval:
-                        task.next_run = datetime.now() + task.interval
-                    else:
-                        # One-shot task, remove it
-                        del self._tasks[task.id]
-
-            await asyncio.sleep(1)  # Check every second
-
-
-# Singleton orchestrator instance
-_orchestrator: Orchestrator | None = None
-
-
+            pending = self._pop_due(time.monotonic())
+
+            # Same-priority tasks run concurrently; priority groups run in order
+            for _, group in itertools.groupby(pending, key=lambda t: t.priority):
+                await asyncio.gather(*(self._run_task(task) for task in group))
+
+            # Sleep until the earliest deadline, or until the schedule changes
+            delay = self._heap[0][0] - time.monotonic() if self._heap else 3600.0
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            self._wake.clear()
+
+    async def _run_task(self, task: ScheduledTask) -> None:
+        """Run one task and reschedule or retire it."""
+        task.running = True
+        logger.debug(f"Running task: {task.name} (priority: {task.priority.value})")
+        try:
+            if task.is_coro:
+                await task.callback()
+            else:
+                # Sync-declared callbacks may still return an awaitable (e.g. lambdas);
+                # any other return value is ignored
+                result = task.callback()
+                if inspect.isawaitable(result):
+                    await result
+            logger.debug(f"Task completed: {task.name}")
+        except Exception as e:
+            logger.error(f"Task {task.name} failed: {e}", exc_info=True)
+        finally:
+            task.running = False
+            task.last_run = time.monotonic()
+
+            if task.interval:
+                task.next_run = task.last_run + task.interval
+                self._push(task)
+            elif self._tasks.get(task.id) is task:
+                # One-shot task, remove it
+                del self._tasks[task.id]
+
+
+@functools.cache
 def get_orchestrator() -> Orchestrator:
-    """Get or create the global orchestrator instance."""
-    global _orchestrator
-    if _orchestrator is None:
-        _orchestrator = Orchestrator()
-    return _orchestrator
+    """Get or create the global orchestrator instance (cached after first call)."""
+    return Orchestrator()
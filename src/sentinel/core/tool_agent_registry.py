@@ -1,8 +1,10 @@
 """Tool agent registry - manages pool of specialized agents."""
 
+import functools
+import itertools
+import secrets
 from datetime import datetime
 from typing import Any, Protocol
-from uuid import uuid4
 
 from sentinel.core.logging import get_logger
 from sentinel.core.types import ContentType, Message
@@ -20,6 +22,10 @@ class ToolAgentProtocol(Protocol):
     async def process(self, message: Message) -> Message: ...
 
 
+# Checked with plain hasattr: isinstance on a runtime_checkable Protocol is much slower
+_REQUIRED_MEMBERS = ("agent_name", "get_capability_description", "process")
+
+
 class ToolAgentRegistry:
     """Registry for tool agents initialized at startup.
 
@@ -35,6 +41,11 @@ class ToolAgentRegistry:
 
     def __init__(self) -> None:
         self._agents: dict[str, ToolAgentProtocol] = {}
+        self._lookup = self._agents.get  # Bound once for get_agent/delegate
+        self._summary_cache: str | None = None  # Invalidated on register
+        # Delegation message ids: random per-registry prefix + counter (no urandom per call)
+        self._msg_prefix = secrets.token_hex(4)
+        self._msg_counter = itertools.count()
 
     def register(self, agent: ToolAgentProtocol) -> None:
         """Register a specialized agent.
@@ -42,18 +53,16 @@ class ToolAgentRegistry:
         Args:
             agent: Agent instance (ToolAgent, AgenticCliAgent, etc.)
         """
-        if not hasattr(agent, "agent_name"):
-            raise ValueError("Agent must have 'agent_name' attribute")
-        if not hasattr(agent, "get_capability_description"):
-            raise ValueError("Agent must have 'get_capability_description' method")
-        if not hasattr(agent, "process"):
-            raise ValueError("Agent must have 'process' method")
+        for member in _REQUIRED_MEMBERS:
+            if not hasattr(agent, member):
+                raise ValueError(f"Agent must implement ToolAgentProtocol (missing '{member}')")
 
         agent_name = agent.agent_name
-        if agent_name in self._agents:
-            logger.warning(f"Agent {agent_name} already registered, replacing")
-
+        previous = self._lookup(agent_name)
         self._agents[agent_name] = agent
+        if previous is not None:
+            logger.warning(f"Agent {agent_name} already registered, replacing")
+        self._summary_cache = None
         logger.info(f"Registered agent: {agent_name}")
 
     def get_agent(self, agent_name: str) -> ToolAgentProtocol | None:
@@ -65,7 +74,7 @@ class ToolAgentRegistry:
         Returns:
             Agent instance or None if not found
         """
-        return self._agents.get(agent_name)
+        return self._lookup(agent_name)
 
     def list_agents(self) -> list[str]:
         """Get list of registered agent names.
@@ -84,14 +93,20 @@ class ToolAgentRegistry:
         Returns:
             Natural language capability list
         """
+        if self._summary_cache is None:
+            self._summary_cache = self._build_summary()
+        return self._summary_cache
+
+    def _build_summary(self) -> str:
+        """Render capability list from registered agents."""
         if not self._agents:
             return "(No specialized agents available)"
 
         lines = ["Available specialized agents:"]
-        for agent in self._agents.values():
-            capability = agent.get_capability_description()
-            lines.append(f"- {agent.agent_name}: {capability}")
-
+        lines.extend(
+            f"- {agent.agent_name}: {agent.get_capability_description()}"
+            for agent in self._agents.values()
+        )
         return "\n".join(lines)
 
     async def delegate(
@@ -111,8 +126,8 @@ class ToolAgentRegistry:
             ValueError: If agent not found
             Exception: On execution failure
         """
-        agent = self._agents.get(agent_name)
-        if not agent:
+        agent = self._lookup(agent_name)
+        if agent is None:
             available = ", ".join(self._agents.keys())
             raise ValueError(f"Tool agent '{agent_name}' not found. Available: {available}")
 
@@ -120,7 +135,7 @@ class ToolAgentRegistry:
 
         # Package task as Message
         message = Message(
-            id=str(uuid4()),
+            id=f"{self._msg_prefix}{next(self._msg_counter):x}",
             timestamp=datetime.now(),
             role="user",
             content=task,
@@ -137,13 +152,7 @@ class ToolAgentRegistry:
         return response.content
 
 
-# Global registry instance
-_global_registry: ToolAgentRegistry | None = None
-
-
+@functools.cache
 def get_tool_agent_registry() -> ToolAgentRegistry:
-    """Get or create global tool agent registry."""
-    global _global_registry
-    if _global_registry is None:
-        _global_registry = ToolAgentRegistry()
-    return _global_registry
+    """Get or create global tool agent registry (cached after first call)."""
+    return ToolAgentRegistry()
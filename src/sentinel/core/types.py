@@ -35,7 +35,7 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Universal message format across interfaces."""
 
@@ -51,39 +51,30 @@ class Message:
 
         Supports multimodal content (text + images) for vision-capable models.
         """
-        # Simple text message
-        if self.content_type == ContentType.TEXT and "images" not in self.metadata:
-            return {"role": self.role, "content": self.content}
-
-        # Multimodal message (text + images)
+        # Single metadata probe decides between plain text and multimodal
         images = self.metadata.get("images")
-        if isinstance(images, list):
-            content_blocks: list[dict[str, Any]] = []
-
-            # Add text block if present
-            if self.content:
-                content_blocks.append({"type": "text", "text": self.content})
-
-            # Add image blocks
-            for img in images:
-                content_blocks.append(
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": img.get("media_type", "image/jpeg"),
-                            "data": img["data"],  # Base64 encoded
-                        },
-                    }
-                )
-
-            return {"role": self.role, "content": content_blocks}
-
-        # Fallback
-        return {"role": self.role, "content": self.content}
-
+        if not isinstance(images, list):
+            return {"role": self.role, "content": self.content}
 
-@dataclass
+        # Multimodal message: optional text block followed by image blocks
+        content_blocks: list[dict[str, Any]] = (
+            [{"type": "text", "text": self.content}] if self.content else []
+        )
+        content_blocks.extend(
+            {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": img.get("media_type", "image/jpeg"),
+                    "data": img["data"],  # Base64 encoded
+                },
+            }
+            for img in images
+        )
+        return {"role": self.role, "content": content_blocks}
+
+
+@dataclass(slots=True)
 class AgentContext:
     """Runtime context for an agent."""
 
@@ -94,7 +85,7 @@ class AgentContext:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Represents an action an agent wants to take."""
 
@@ -106,7 +97,7 @@ class Action:
     requires_approval: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     """Result of an executed action."""
 
@@ -2,15 +2,20 @@
 
 import asyncio
 import base64
+import re
+import secrets
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timedelta
 from io import BytesIO
 from typing import Any
 
-from telegram import BotCommand, Update
+from telegram import Bot, BotCommand, Update
 from telegram.constants import ParseMode
 from telegram.ext import (
+    AIORateLimiter,
     Application,
+    BaseRateLimiter,
     CommandHandler,
     ContextTypes,
     MessageHandler,
@@ -30,22 +35,114 @@ from sentinel.interfaces.base import InboundMessage, Interface, OutboundMessage
 from sentinel.llm.router import SentinelLLMRouter, create_default_router
 from sentinel.memory.store import SQLiteMemoryStore
 from sentinel.tasks.manager import TaskManager
+from sentinel.tasks.types import TaskType
 from sentinel.tools.builtin import register_all_builtin_tools
 from sentinel.tools.builtin.agenda import set_data_dir
 from sentinel.tools.builtin.tasks import set_task_manager
+from sentinel.tools.builtin.web_search import set_brave_api_key
 from sentinel.tools.registry import get_global_registry
 
 logger = get_logger("interfaces.telegram")
 
+WEBHOOK_PATH = "telegram"
+
+# Every handler (commands, text, photos) consumes plain messages; skip all other update types
+ALLOWED_UPDATES = [Update.MESSAGE]
+
+# Max retries of a send rejected with RetryAfter (HTTP 429) when rate limiting is on
+RATE_LIMIT_MAX_RETRIES = 3
+
+# Characters that can start markdown formatting; text without any is sent as plain text
+MARKDOWN_TOKENS = frozenset("*_`[~#>|")
+
+# Time token of "/schedule <pattern> <time> <task>"; mirrors ScheduleParser.parse_recurring
+SCHEDULE_TIME_RE = re.compile(r"\d{1,2}:?(?:\d{2})?(?:am|pm)?", re.IGNORECASE)
+
+# Reply costs are summed and logged once per this many replies (remainder flushed on stop)
+COST_LOG_EVERY = 10
+
+# Startup retries for transient Telegram errors; a bad token or webhook config fails fast
+BOOTSTRAP_RETRIES = 3
+
+# Back-off before retrying due tasks after a failed run (or failed re-arm), in seconds
+DUE_TASKS_RETRY_DELAY = 60.0
+
+# Telegram caps message text at 4096 UTF-16 code units (emoji count as two)
+TELEGRAM_MAX_LENGTH = 4096
+TRUNCATED_SUFFIX = "\n\n_(truncated)_"
+
+HELP_TEXT = """*Commands*
+/start - Initialize bot
+/status - Show agent status
+/clear - Clear conversation history
+/agenda - Show current agenda
+/memory - Show memory system overview
+/code <task> - Generate and execute Python code
+/remind <time> <message> - Set one-time reminder (e.g., /remind 5m call mom)
+/schedule <pattern> <task> - Schedule recurring task (e.g., /schedule daily 9am check news)
+/tasks - List active scheduled tasks
+/cancel <task_id> - Cancel a task
+/ctx - Show debug context
+/kill - Gracefully shutdown the bot
+/help - This message
+
+Just send a message to chat with me."""
+
+# /memory tier sizes, fetched in one round trip
+MEMORY_COUNTS_SQL = (
+    "SELECT (SELECT COUNT(*) FROM episodes), "
+    "(SELECT COUNT(*) FROM facts WHERE superseded_by IS NULL)"
+)
+
+CODE_USAGE = (
+    "Usage: /code <task description>\nExample: /code Calculate the first 20 Fibonacci numbers"
+)
+
+REMIND_USAGE = (
+    "Usage: /remind <time> <message>\n"
+    "Examples:\n"
+    "  /remind 5m call mom\n"
+    "  /remind 2h check oven\n"
+    "  /remind 1d submit report"
+)
+
+STATUS_TEMPLATE = """*Status*
+Agent: {agent}
+Memory: {memory}
+Providers: {providers}
+Conversation: {conv_len} messages"""
+
+
+CommandCallback = Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]
+
+
+def _truncate_for_telegram(text: str, limit: int = TELEGRAM_MAX_LENGTH) -> str:
+    """Truncate text to fit Telegram's limit, measured in UTF-16 code units."""
+    if len(text) * 2 <= limit:  # Fits even if every character were a surrogate pair
+        return text
+    encoded = text.encode("utf-16-le")
+    if len(encoded) <= limit * 2:
+        return text
+    # Cutting mid surrogate pair leaves a lone half, which errors="ignore" drops
+    budget = (limit - len(TRUNCATED_SUFFIX)) * 2
+    return encoded[:budget].decode("utf-16-le", errors="ignore") + TRUNCATED_SUFFIX
+
+
+def _local_time(sent_at: datetime | None) -> datetime:
+    """Convert Telegram's UTC message date to the naive local time used across the app."""
+    return sent_at.astimezone().replace(tzinfo=None) if sent_at else datetime.now()
+
 
 class TelegramInterface(Interface):
     """Telegram bot interface with persona from identity.md."""
 
     def __init__(self) -> None:
         settings = get_settings()
+        self._settings = settings  # Captured once; reused by init, start and auto-pause
         self.token = settings.telegram_token
         self.owner_id = settings.telegram_owner_id
         self.app: Application | None = None
+        self._bot: Bot | None = None  # app.bot, bound once the app is initialized
         self.agent: DialogAgent | None = None
         self.memory: SQLiteMemoryStore | None = None
         self._router: SentinelLLMRouter | None = None
@@ -57,22 +154,56 @@ class TelegramInterface(Interface):
         self._last_message_time: datetime | None = None
         self._shutdown_event = asyncio.Event()
         self._paused: bool = False
+        self._bot_name = "Sentinel"  # Derived from identity.md at init
+        self._providers_text = "none"  # For /status; provider availability is fixed at init
+        self._agenda_reply: tuple[str, str] = ("", "")  # (agenda, its /agenda reply text)
+        self._cost_total = 0.0  # Reply cost accumulated since the last cost log line
+        self._cost_replies = 0
+        self._commands: dict[str, CommandCallback] = {
+            "start": self._handle_start,
+            "help": self._handle_help,
+            "status": self._handle_status,
+            "clear": self._handle_clear,
+            "agenda": self._handle_agenda,
+            "memory": self._handle_memory,
+            "code": self._handle_code,
+            "remind": self._handle_remind,
+            "schedule": self._handle_schedule,
+            "tasks": self._handle_tasks,
+            "cancel": self._handle_cancel,
+            "ctx": self._handle_ctx,
+            "pause": self._handle_pause,
+            "kill": self._handle_kill,
+        }
+        # Dialog turns share one conversation, so they run one at a time (in arrival order);
+        # only quick commands run concurrently
+        self._dialog_lock = asyncio.Lock()
+        # Backpressure: bounds LLM work (dialog turns, running or queued on _dialog_lock,
+        # plus /code runs), so a burst waits here instead of piling up behind the lock
+        self._inflight = asyncio.Semaphore(max(1, settings.telegram_max_inflight))
+        # Proactive sends (notifications, send()) are queued so callers never wait on HTTP
+        self._outbox: asyncio.Queue[tuple[int, str, bool]] = asyncio.Queue(maxsize=256)
+        self._sender_task: asyncio.Task[None] | None = None
 
     async def _init_components(self) -> None:
         """Initialize agent and memory store."""
-        settings = get_settings()
+        settings = self._settings
 
         self.memory = SQLiteMemoryStore(settings.db_path)
         await self.memory.connect()
 
         router = create_default_router()
         self._router = router
-        if not router.available_providers:
+        providers = router.available_providers
+        if not providers:
             raise RuntimeError("No LLM providers available")
+        self._providers_text = ", ".join(providers)
 
         # Initialize task manager first (needed by tools)
         self._task_manager = TaskManager(
-            memory=self.memory, notification_callback=self._send_notification
+            memory=self.memory,
+            notification_callback=self._send_notification,
+            schedule_callback=self._arm_due_tasks,
         )
 
         # Register builtin tools
@@ -81,8 +212,6 @@ class TelegramInterface(Interface):
         set_data_dir(settings.data_dir)
 
         # Set API keys for external services
-        from sentinel.tools.builtin.web_search import set_brave_api_key
-
         set_brave_api_key(settings.brave_search_api_key)
 
         # Get tool registry for DialogAgent
@@ -109,6 +238,9 @@ class TelegramInterface(Interface):
         )
         await self.agent.initialize()
 
+        first_line = (self.agent._identity or "").partition("\n")[0]
+        self._bot_name = "Senti" if "Senti" in first_line else "Sentinel"
+
         # Set Telegram markdown capabilities
         telegram_capabilities = """## Communication Channel
 You are communicating via Telegram, which supports Markdown formatting:
@@ -162,6 +294,8 @@ Format your responses with appropriate markdown for better readability."""
             interval=timedelta(minutes=30),
             priority=TaskPriority.LOW,
         )
+        # Due tasks run on a one-shot timer re-armed for the earliest next_run (edge-triggered)
+        await self._arm_due_tasks()
         await self._orchestrator.start()
 
         logger.info(f"Initialized with identity: {settings.identity_path}")
@@ -175,34 +309,80 @@ Format your responses with appropriate markdown for better readability."""
 
         await self._init_components()
 
-        self.app = Application.builder().token(self.token).build()
-
-        # Register handlers
-        self.app.add_handler(CommandHandler("start", self._handle_start))
-        self.app.add_handler(CommandHandler("help", self._handle_help))
-        self.app.add_handler(CommandHandler("status", self._handle_status))
-        self.app.add_handler(CommandHandler("clear", self._handle_clear))
-        self.app.add_handler(CommandHandler("agenda", self._handle_agenda))
-        self.app.add_handler(CommandHandler("memory", self._handle_memory))
-        self.app.add_handler(CommandHandler("code", self._handle_code))
-        self.app.add_handler(CommandHandler("remind", self._handle_remind))
-        self.app.add_handler(CommandHandler("schedule", self._handle_schedule))
-        self.app.add_handler(CommandHandler("tasks", self._handle_tasks))
-        self.app.add_handler(CommandHandler("cancel", self._handle_cancel))
-        self.app.add_handler(CommandHandler("ctx", self._handle_ctx))
-        self.app.add_handler(CommandHandler("pause", self._handle_pause))
-        self.app.add_handler(CommandHandler("kill", self._handle_kill))
-        self.app.add_handler(MessageHandler(filters.PHOTO, self._handle_photo))
-        self.app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self._handle_message))
+        # Concurrent updates: PTB dispatches each update in its own task (capped at 256),
+        # so a slow handler never holds up the rest; dialog turns still serialize on _dialog_lock
+        builder = Application.builder().token(self.token).concurrent_updates(True)
+        rate_limiter = self._build_rate_limiter()
+        if rate_limiter:
+            builder = builder.rate_limiter(rate_limiter)
+        self.app = builder.build()
+
+        # Register handlers; filters drop non-owner and non-matching updates before dispatch,
+        # so handlers can rely on update.message (and its text/photo) being present
+        owner = filters.User(user_id=self.owner_id)
+        # All commands share one handler: a single filter check per update, then a dict lookup.
+        # block=False: quick commands and chat don't wait behind a slow LLM turn
+        self.app.add_handler(
+            CommandHandler(list(self._commands), self._dispatch_command, filters=owner, block=False)
+        )
+        self.app.add_handler(MessageHandler(filters.PHOTO & owner, self._handle_photo))
+        self.app.add_handler(
+            MessageHandler(
+                filters.TEXT & ~filters.COMMAND & owner, self._handle_message, block=False
+            )
+        )
 
         logger.info(f"Starting Telegram bot for owner {self.owner_id}")
         await self.app.initialize()
+        self._bot = self.app.bot
         await self.app.start()
 
-        # Set up bot command menu
-        await self._setup_bot_commands()
+        self._sender_task = asyncio.create_task(self._sender_loop())
+
+        # The command menu (setMyCommands) is independent of update intake, so the two
+        # round trips overlap; _setup_bot_commands logs its own failures
+        await asyncio.gather(self._setup_bot_commands(), self._start_updates())
+
+    async def _start_updates(self) -> None:
+        """Start receiving updates via webhook if configured, else long polling."""
+        settings = self._settings
+        if settings.telegram_webhook_url:
+            # Webhook: Telegram pushes updates, no outbound polling
+            webhook_url = f"{settings.telegram_webhook_url.rstrip('/')}/{WEBHOOK_PATH}"
+            # Never serve an unauthenticated endpoint: anyone reaching the port could post
+            # forged owner updates. PTB registers the generated secret via setWebhook itself
+            secret = settings.telegram_webhook_secret or secrets.token_urlsafe(32)
+            await self.app.updater.start_webhook(
+                listen=settings.telegram_webhook_listen,
+                port=settings.telegram_webhook_port,
+                url_path=WEBHOOK_PATH,
+                webhook_url=webhook_url,
+                allowed_updates=ALLOWED_UPDATES,
+                secret_token=secret,
+                bootstrap_retries=BOOTSTRAP_RETRIES,
+            )
+            logger.info(f"Receiving updates via webhook at {webhook_url}")
+        else:
+            # Long polling: server holds getUpdates open until an update arrives (or 30s pass)
+            await self.app.updater.start_polling(
+                allowed_updates=ALLOWED_UPDATES,
+                timeout=30,
+                poll_interval=0.0,
+                bootstrap_retries=BOOTSTRAP_RETRIES,
+            )
 
-        await self.app.updater.start_polling(allowed_updates=Update.ALL_TYPES)
+    def _build_rate_limiter(self) -> BaseRateLimiter[Any] | None:
+        """Build the outbound rate limiter if enabled (None = send unpaced)."""
+        if not self._settings.telegram_rate_limit:
+            return None
+        try:
+            # Defaults track Telegram's flood limits (30 msg/s overall, 20 msg/min per group)
+            limiter = AIORateLimiter(max_retries=RATE_LIMIT_MAX_RETRIES)
+        except RuntimeError:
+            logger.warning("aiolimiter not installed, sending without rate limiting")
+            return None
+        logger.info("Outbound rate limiting enabled")
+        return limiter
 
     async def stop(self) -> None:
         """Stop Telegram bot, summarizing session first."""
@@ -217,22 +397,38 @@ Format your responses with appropriate markdown for better readability."""
             except Exception as e:
                 logger.warning(f"Failed to summarize on shutdown: {e}")
 
-        # Stop orchestrator and background agents
-        logger.info("Stopping orchestrator and background agents")
-        await self._orchestrator.stop()
-
-        # Close LLM router connections
+        # Independent teardown runs concurrently; one failure doesn't strand the rest
+        logger.info("Stopping orchestrator, LLM router and update intake")
+        steps = [self._orchestrator.stop()]
         if self._router:
-            logger.info("Closing LLM router connections")
-            await self._router.close_all()
+            steps.append(self._router.close_all())
+        if self.app:
+            steps.append(self.app.updater.stop())
+        for result in await asyncio.gather(*steps, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Shutdown step failed: {result}")
+
+        # Flush queued notifications while the bot can still send, then stop the sender
+        if self._sender_task:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._outbox.join(), timeout=5.0)
+            self._sender_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sender_task
 
         # Stop Telegram application
         if self.app:
+            # app.stop() waits for in-flight handlers, so memory closes only afterwards
             logger.info("Stopping Telegram application")
-            await self.app.updater.stop()
             await self.app.stop()
             await self.app.shutdown()
 
+        # Turns finished above may still be persisting their exchange in the background
+        if self.agent:
+            await self.agent.flush_pending_writes()
+
+        self._flush_cost_log()
+
         # Close memory store
         if self.memory:
             logger.info("Closing memory store")
@@ -244,9 +440,9 @@ Format your responses with appropriate markdown for better readability."""
         raise NotImplementedError("Telegram uses callback-based message handling")
 
     async def send(self, message: OutboundMessage) -> None:
-        """Send message to owner."""
-        if self.app and self.owner_id:
-            await self._safe_reply(
+        """Send message to owner (queued, delivered by the sender task)."""
+        if self.owner_id:
+            self._enqueue(
                 self.owner_id, message.content, is_markdown=(message.format == "markdown")
             )
 
@@ -264,7 +460,11 @@ Format your responses with appropriate markdown for better readability."""
         async def send_typing_periodically():
             try:
                 while True:
-                    await chat.send_action("typing")
+                    # A failed typing action must never break the reply itself
+                    try:
+                        await chat.send_action("typing")
+                    except Exception as e:
+                        logger.debug(f"Typing action failed: {e}")
                     await asyncio.sleep(4.5)  # Refresh before 5s timeout
             except asyncio.CancelledError:
                 pass
@@ -277,6 +477,20 @@ Format your responses with appropriate markdown for better readability."""
             with suppress(asyncio.CancelledError):
                 await task
 
+    def _record_cost(self, cost: float) -> None:
+        """Accumulate reply cost, logging the running total once per batch."""
+        self._cost_total += cost
+        self._cost_replies += 1
+        if self._cost_replies >= COST_LOG_EVERY:
+            self._flush_cost_log()
+
+    def _flush_cost_log(self) -> None:
+        """Log and reset the accumulated reply cost, if any replies are pending."""
+        if self._cost_replies:
+            logger.info(f"Reply cost: ${self._cost_total:.4f} over {self._cost_replies} replies")
+            self._cost_total = 0.0
+            self._cost_replies = 0
+
     def _should_quote_reply(self, message_time: datetime) -> bool:
         """Determine if we should quote-reply based on message timing.
 
@@ -295,7 +509,7 @@ Format your responses with appropriate markdown for better readability."""
         """Auto-pause if no user input received within the configured threshold."""
         if self._paused:
             return
-        settings = get_settings()
+        settings = self._settings
         if not settings.auto_pause_hours:
             return
         if self._last_message_time is None:
@@ -319,32 +533,94 @@ Format your responses with appropriate markdown for better readability."""
                 logger.info(f"Sleep cycle: {result}")
 
     async def _run_awareness_check(self) -> None:
-        """Run awareness agent checks and task execution."""
-        # Check awareness agent reminders/monitors
+        """Run awareness agent reminder/monitor checks."""
         if self._awareness_agent:
             await self._awareness_agent.check_all()
+        # Safety net for the due-task timer: recomputes the delay from the wall clock, which
+        # corrects monotonic drift (suspend, DST) and revives a timer lost to an error
+        await self._arm_due_tasks()
 
-        # Check and execute due tasks
-        if self._task_manager:
-            results = await self._task_manager.check_and_execute_due_tasks()
-            if results:
-                logger.debug(f"Executed {len(results)} tasks")
+    async def _arm_due_tasks(self, min_delay: float = 0.0) -> None:
+        """Schedule the due-task run for when the earliest task is due (or drop it if none)."""
+        if not self._task_manager:
+            return
+        try:
+            next_run = await self._task_manager.next_due()
+        except Exception as e:
+            logger.error(f"Failed to look up next due task: {e}")
+            next_run = datetime.now()
+            min_delay = max(min_delay, DUE_TASKS_RETRY_DELAY)
+        if next_run is None:
+            self._orchestrator.cancel_task("due_tasks")
+            return
+        delay = max(min_delay, (next_run - datetime.now()).total_seconds())
+        # Re-scheduling under the same id replaces any previously armed run
+        self._orchestrator.schedule_task(
+            task_id="due_tasks",
+            name="Due tasks",
+            callback=self._run_due_tasks,
+            delay=timedelta(seconds=delay),
+        )
+
+    async def _run_due_tasks(self) -> None:
+        """Execute due tasks, then re-arm for the next one."""
+        failed = True
+        try:
+            if self._task_manager:
+                results = await self._task_manager.check_and_execute_due_tasks()
+                if results:
+                    logger.debug(f"Executed {len(results)} tasks")
+            failed = False
+        finally:
+            # Always re-arm, or one failed run (e.g. database locked) would stop all tasks;
+            # back off after a failure so a persistent error can't spin at zero delay
+            await self._arm_due_tasks(min_delay=DUE_TASKS_RETRY_DELAY if failed else 0.0)
 
     async def _send_notification(self, message: str) -> None:
-        """Send proactive notification to owner."""
-        if self.app and self.owner_id:
-            await self._safe_reply(self.owner_id, f"🔔 {message}", is_markdown=False)
+        """Send proactive notification to owner (queued, delivered by the sender task)."""
+        if self.owner_id:
+            self._enqueue(self.owner_id, f"🔔 {message}", is_markdown=False)
+
+    def _enqueue(self, chat_id: int, text: str, is_markdown: bool) -> None:
+        """Queue an outbound message, dropping it if the outbox is full."""
+        try:
+            self._outbox.put_nowait((chat_id, text, is_markdown))
+        except asyncio.QueueFull:
+            logger.warning("Outbound queue full, dropping message")
+
+    async def _sender_loop(self) -> None:
+        """Deliver queued messages in order, one at a time."""
+        while True:
+            chat_id, text, is_markdown = await self._outbox.get()
+            try:
+                await self._safe_reply(chat_id, text, is_markdown=is_markdown)
+            except Exception as e:
+                logger.error(f"Failed to send queued message: {e}", exc_info=True)
+            finally:
+                self._outbox.task_done()
 
     async def _safe_reply(
         self, chat_id: int, text: str, is_markdown: bool = True, reply_to: int | None = None
     ) -> None:
         """Send message with Telegram markdown formatting and auto-splitting."""
-        if not self.app:
+        bot = self._bot
+        if not bot:
+            return
+
+        # Nothing to format: skip telegramify and the MarkdownV2 parse (and its failure path)
+        if is_markdown and MARKDOWN_TOKENS.isdisjoint(text):
+            is_markdown = False
+
+        # Short plain text (notifications, most command replies) is a single send
+        if not is_markdown and len(text) <= 4000:
+            await self._send_chunk(bot, chat_id, text, is_markdown=False, reply_to=reply_to)
             return
 
         # Use telegramify to format and split messages
         if is_markdown:
             try:
+                # Kept local: these names moved between telegramify releases, and a mismatch
+                # should degrade to the plain-text fallback below, not break module import
                 from telegramify_markdown import TextInterpreter
                 from telegramify_markdown.type import ContentTypes
 
@@ -359,11 +635,11 @@ Format your responses with appropriate markdown for better readability."""
 
                 # Send each text box as a separate message
                 for i, box in enumerate(boxes):
-                    if box.content_type == ContentTypes.TEXT:
+                    if box.content_type is ContentTypes.TEXT:
                         # Only reply_to on first chunk
                         reply_id = reply_to if i == 0 else None
                         await self._send_chunk(
-                            self.app, chat_id, box.content, is_markdown=True, reply_to=reply_id
+                            bot, chat_id, box.content, is_markdown=True, reply_to=reply_id
                         )
             except Exception as e:
                 logger.warning(f"Telegram markdown formatting failed: {e}, sending plain text")
@@ -372,186 +648,148 @@ Format your responses with appropriate markdown for better readability."""
                 for i, chunk in enumerate(chunks):
                     reply_id = reply_to if i == 0 else None
                     await self._send_chunk(
-                        self.app, chat_id, chunk, is_markdown=False, reply_to=reply_id
+                        bot, chat_id, chunk, is_markdown=False, reply_to=reply_id
                     )
         else:
             # Plain text mode - still needs splitting for long messages
             chunks = self._split_message(text, 4000)
             for i, chunk in enumerate(chunks):
                 reply_id = reply_to if i == 0 else None
-                await self._send_chunk(
-                    self.app, chat_id, chunk, is_markdown=False, reply_to=reply_id
-                )
+                await self._send_chunk(bot, chat_id, chunk, is_markdown=False, reply_to=reply_id)
 
     async def _send_chunk(
         self,
-        app: Any,
+        bot: Bot,
         chat_id: int,
         text: str,
         is_markdown: bool,
         reply_to: int | None,
     ) -> None:
         """Send a single message chunk with markdown fallback."""
-        try:
-            if is_markdown:
+        if is_markdown:
+            try:
                 # telegramify outputs MarkdownV2 format
-                await app.bot.send_message(
+                await bot.send_message(
                     chat_id=chat_id,
                     text=text,
                     parse_mode=ParseMode.MARKDOWN_V2,
                     reply_to_message_id=reply_to,
                 )
-            else:
-                await app.bot.send_message(chat_id=chat_id, text=text, reply_to_message_id=reply_to)
+                return
+            except Exception as e:
+                logger.warning(f"Markdown failed, falling back to plain: {e}")
+
+        # Plain text is sent once: retrying an identical request can't fix a parse error
+        try:
+            await bot.send_message(chat_id=chat_id, text=text, reply_to_message_id=reply_to)
         except Exception as e:
-            logger.warning(f"Markdown failed, falling back to plain: {e}")
-            try:
-                await app.bot.send_message(chat_id=chat_id, text=text, reply_to_message_id=reply_to)
-            except Exception as e2:
-                logger.error(f"Failed to send message: {e2}", exc_info=True)
+            logger.error(f"Failed to send message: {e}", exc_info=True)
 
     def _split_message(self, text: str, max_len: int) -> list[str]:
         """Split message into chunks, preferring line breaks (for plain text fallback)."""
         if len(text) <= max_len:
             return [text]
 
+        # Walk a cursor forward instead of re-slicing the remaining tail each time
         chunks = []
-        while text:
-            if len(text) <= max_len:
-                chunks.append(text)
+        start, n = 0, len(text)
+        while start < n:
+            end = start + max_len
+            if end >= n:
+                chunks.append(text[start:])
                 break
 
-            # Find a good break point (newline or space)
-            split_at = max_len
-            newline_pos = text.rfind("\n", 0, max_len)
-            if newline_pos > max_len // 2:
-                split_at = newline_pos + 1
+            # Find a good break point (newline or space) in the back half of the window
+            min_split = start + max_len // 2
+            newline_pos = text.rfind("\n", start, end)
+            if newline_pos > min_split:
+                end = newline_pos + 1
             else:
-                space_pos = text.rfind(" ", 0, max_len)
-                if space_pos > max_len // 2:
-                    split_at = space_pos + 1
+                space_pos = text.rfind(" ", start, end)
+                if space_pos > min_split:
+                    end = space_pos + 1
 
-            chunks.append(text[:split_at])
-            text = text[split_at:]
+            chunks.append(text[start:end])
+            start = end
 
         return chunks
 
+    async def _dispatch_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Route a command to its handler ("/Cmd@BotName args" -> "cmd")."""
+        command = update.message.text.split(maxsplit=1)[0][1:].split("@", 1)[0].lower()
+        handler = self._commands.get(command)
+        if handler:
+            await handler(update, context)
+
     async def _handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /start command."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
-        # Extract name from identity if available
-        name = "Sentinel"
-        if self.agent and self.agent._identity:
-            first_line = self.agent._identity.split("\n")[0]
-            if "Senti" in first_line:
-                name = "Senti"
-
-        await update.message.reply_text(f"Hey! I'm {name}, ready to help. Send /help for commands.")
+        await update.message.reply_text(
+            f"Hey! I'm {self._bot_name}, ready to help. Send /help for commands."
+        )
 
     async def _handle_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
-        help_text = """*Commands*
-/start - Initialize bot
-/status - Show agent status
-/clear - Clear conversation history
-/agenda - Show current agenda
-/memory - Show memory system overview
-/code <task> - Generate and execute Python code
-/remind <time> <message> - Set one-time reminder (e.g., /remind 5m call mom)
-/schedule <pattern> <task> - Schedule recurring task (e.g., /schedule daily 9am check news)
-/tasks - List active scheduled tasks
-/cancel <task_id> - Cancel a task
-/ctx - Show debug context
-/kill - Gracefully shutdown the bot
-/help - This message
-
-Just send a message to chat with me."""
-
-        await self._safe_reply(update.effective_chat.id, help_text)
+        await self._safe_reply(update.effective_chat.id, HELP_TEXT)
 
     async def _handle_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /status command."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
-        providers = "none"
-        if self._router:
-            providers = ", ".join(self._router.available_providers)
         conv_len = len(self.agent.context.conversation) if self.agent else 0
 
-        status = f"""*Status*
-Agent: {"Active" if self.agent else "Not initialized"}
-Memory: {"Connected" if self.memory else "Disconnected"}
-Providers: {providers}
-Conversation: {conv_len} messages"""
+        status = STATUS_TEMPLATE.format(
+            agent="Active" if self.agent else "Not initialized",
+            memory="Connected" if self.memory else "Disconnected",
+            providers=self._providers_text,
+            conv_len=conv_len,
+        )
 
         await self._safe_reply(update.effective_chat.id, status)
 
     async def _handle_clear(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /clear command - summarize then clear conversation."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if self.agent:
-            # Summarize before clearing if there's content
-            if len(self.agent.context.conversation) >= 2:
-                summary = await self.agent.summarize_session()
-                if summary:
-                    await update.message.reply_text(f"Session saved: {summary[:200]}")
-            self.agent.context.conversation.clear()
+            summary = None
+            # Under the dialog lock: an in-flight turn finishes (and is summarized) first,
+            # rather than appending its reply to the fresh conversation
+            async with self._dialog_lock:
+                # Summarize before clearing if there's content
+                if len(self.agent.context.conversation) >= 2:
+                    summary = await self.agent.summarize_session()
+                self.agent.context.conversation = []
+            if summary:
+                await update.message.reply_text(f"Session saved: {summary[:200]}")
             await update.message.reply_text("Conversation cleared.")
 
     async def _handle_agenda(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /agenda command - show current agenda."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if self.agent and self.agent._agenda:
-            # Truncate if too long for Telegram
             agenda = self.agent._agenda
-            if len(agenda) > 4000:
-                agenda = agenda[:4000] + "\n\n_(truncated)_"
-            await self._safe_reply(update.effective_chat.id, agenda)
+            source, reply = self._agenda_reply
+            # The agenda rarely changes between calls; equal text skips re-truncating
+            if agenda != source:
+                reply = _truncate_for_telegram(agenda)
+                self._agenda_reply = (agenda, reply)
+            await self._safe_reply(update.effective_chat.id, reply)
         else:
             await update.message.reply_text("No agenda set.")
 
     async def _handle_memory(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /memory command - show memory system overview."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if not self.memory:
             await update.message.reply_text("Memory not initialized.")
             return
 
         try:
             # Gather memory statistics
-            from datetime import datetime, timedelta
-
             # 1. Get memory counts
             episodic_count = 0
             semantic_count = 0
 
-            # Count episodic memories
+            # Count episodic memories and semantic memories (facts)
             try:
-                async with self.memory.conn.execute("SELECT COUNT(*) FROM episodes") as cursor:
+                async with self.memory.reader.execute(MEMORY_COUNTS_SQL) as cursor:
                     row = await cursor.fetchone()
-                    episodic_count = row[0] if row else 0
-            except Exception:
-                pass
-
-            # Count semantic memories (facts)
-            try:
-                async with self.memory.conn.execute(
-                    "SELECT COUNT(*) FROM facts WHERE superseded_by IS NULL"
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    semantic_count = row[0] if row else 0
+                    if row:
+                        episodic_count, semantic_count = row
             except Exception:
                 pass
 
@@ -559,7 +797,7 @@ Conversation: {conv_len} messages"""
             recent_memories = []
             try:
                 yesterday = datetime.now() - timedelta(days=1)
-                async with self.memory.conn.execute(
+                async with self.memory.reader.execute(
                     "SELECT summary, timestamp FROM episodes WHERE timestamp > ? "
                     "ORDER BY timestamp DESC LIMIT 5",
                     (yesterday,),
@@ -605,6 +843,22 @@ Conversation: {conv_len} messages"""
             if self.agent:
                 working_memory_size = len(self.agent.context.conversation)
 
+            # 6. Recent activity lines
+            activity = []
+            for mem in recent_memories[:3]:
+                # Format timestamp
+                ts = mem["timestamp"]
+                if isinstance(ts, str):
+                    ts = datetime.fromisoformat(ts)
+                time_str = ts.strftime("%H:%M") if isinstance(ts, datetime) else "?"
+                # Truncate content
+                content = mem["content"][:80]
+                if len(mem["content"]) > 80:
+                    content += "..."
+                activity.append(f"• {time_str}: {content}\n")
+            if not activity:
+                activity.append("• No recent memories\n")
+
             # Build response
             report = f"""*Memory System Overview*
 
@@ -620,22 +874,7 @@ Conversation: {conv_len} messages"""
 {agenda_summary}
 
 🕒 *Recent Activity* (last 24h)
-"""
-
-            if recent_memories:
-                for mem in recent_memories[:3]:
-                    # Format timestamp
-                    ts = mem["timestamp"]
-                    if isinstance(ts, str):
-                        ts = datetime.fromisoformat(ts)
-                    time_str = ts.strftime("%H:%M") if isinstance(ts, datetime) else "?"
-                    # Truncate content
-                    content = mem["content"][:80]
-                    if len(mem["content"]) > 80:
-                        content += "..."
-                    report += f"• {time_str}: {content}\n"
-            else:
-                report += "• No recent memories\n"
+{"".join(activity)}"""
 
             await self._safe_reply(update.effective_chat.id, report)
 
@@ -645,19 +884,13 @@ Conversation: {conv_len} messages"""
 
     async def _handle_code(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /code command - generate and execute Python code."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if not self._code_agent:
             await update.message.reply_text("Code agent not initialized. Please restart.")
             return
 
         # Extract task from command arguments
         if not context.args:
-            await update.message.reply_text(
-                "Usage: /code <task description>\n"
-                "Example: /code Calculate the first 20 Fibonacci numbers"
-            )
+            await update.message.reply_text(CODE_USAGE)
             return
 
         task = " ".join(context.args)
@@ -671,7 +904,7 @@ Conversation: {conv_len} messages"""
             # Create message for code agent
             message = Message(
                 id=str(update.message.message_id),
-                timestamp=datetime.now(),
+                timestamp=_local_time(update.message.date),
                 role="user",
                 content=task,
                 content_type=ContentType.TEXT,
@@ -679,7 +912,7 @@ Conversation: {conv_len} messages"""
             )
 
             # Execute code task with persistent typing indicator
-            async with self._typing_indicator(update.message.chat):
+            async with self._typing_indicator(update.message.chat), self._inflight:
                 response = await self._code_agent.process(message)
 
             logger.info(f"CODE COMPLETE: {response.content[:100]}")
@@ -698,21 +931,12 @@ Conversation: {conv_len} messages"""
 
     async def _handle_remind(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /remind command - set one-time reminder."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if not self._task_manager:
             await update.message.reply_text("Task manager not initialized.")
             return
 
         if not context.args or len(context.args) < 2:
-            await update.message.reply_text(
-                "Usage: /remind <time> <message>\n"
-                "Examples:\n"
-                "  /remind 5m call mom\n"
-                "  /remind 2h check oven\n"
-                "  /remind 1d submit report"
-            )
+            await update.message.reply_text(REMIND_USAGE)
             return
 
         delay = context.args[0]
@@ -730,9 +954,6 @@ Conversation: {conv_len} messages"""
 
     async def _handle_schedule(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /schedule command - schedule recurring reminder."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if not self._task_manager:
             await update.message.reply_text("Task manager not initialized.")
             return
@@ -750,10 +971,7 @@ Conversation: {conv_len} messages"""
         # Parse schedule pattern - could be "daily 9am" or "weekdays 6pm" etc
         # We need to find where the pattern ends and task description begins
         # For simplicity, assume pattern is first 1-2 args
-        time_token = (
-            context.args[1].replace(":", "").replace("am", "").replace("pm", "").replace(".", "")
-        )
-        if len(context.args) >= 3 and time_token.isdigit():
+        if len(context.args) >= 3 and SCHEDULE_TIME_RE.fullmatch(context.args[1]):
             # Pattern is 2 words: "daily 9am"
             schedule = f"{context.args[0]} {context.args[1]}"
             description = " ".join(context.args[2:])
@@ -765,8 +983,6 @@ Conversation: {conv_len} messages"""
             )
             return
 
-        from sentinel.tasks.types import TaskType
-
         result = await self._task_manager.add_recurring_task(
             schedule=schedule,
             task_type=TaskType.REMINDER,
@@ -784,9 +1000,6 @@ Conversation: {conv_len} messages"""
 
     async def _handle_tasks(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /tasks command - list active tasks."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if not self._task_manager:
             await update.message.reply_text("Task manager not initialized.")
             return
@@ -797,21 +1010,15 @@ Conversation: {conv_len} messages"""
             await update.message.reply_text("No active tasks.")
             return
 
-        lines = ["*Active Tasks*\n"]
-        for task in tasks:
-            task_type = task["schedule_type"]
-            lines.append(
-                f"`{task['id']}` [{task_type}] {task['description']}\n"
-                f"  Next: {task['next_run'][:16]}\n"
-            )
-
-        await self._safe_reply(update.effective_chat.id, "\n".join(lines))
+        entries = "\n".join(
+            f"`{task['id']}` [{task['schedule_type']}] {task['description']}\n"
+            f"  Next: {task['next_run'][:16]}\n"
+            for task in tasks
+        )
+        await self._safe_reply(update.effective_chat.id, f"*Active Tasks*\n\n{entries}")
 
     async def _handle_cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /cancel command - cancel a task."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if not self._task_manager:
             await update.message.reply_text("Task manager not initialized.")
             return
@@ -830,9 +1037,6 @@ Conversation: {conv_len} messages"""
 
     async def _handle_ctx(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /ctx command - show raw dialog context for debugging."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
-
         if not self.agent:
             await update.message.reply_text("Agent not initialized.")
             return
@@ -873,13 +1077,12 @@ Agenda Path: `{self.agent._agenda_path}`
 
     async def _handle_pause(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /pause command - suspend LLM processing until next message."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            return
         self._paused = True
         await update.message.reply_text("Paused. LLM processing suspended until next message.")
 
     async def _handle_kill(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /kill command - gracefully shutdown the bot."""
+        # Already owner-filtered at registration; re-checked since this ends the process
         if not update.effective_user or not self._is_owner(update.effective_user.id):
             return
 
@@ -972,13 +1175,6 @@ Agenda Path: `{self.agent._agenda_path}`
 
     async def _handle_photo(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle incoming photo messages with vision support."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            logger.debug(f"Ignoring photo from non-owner: {update.effective_user.id}")
-            return
-
-        if not update.message or not update.message.photo:
-            return
-
         if not self.agent:
             await update.message.reply_text("Agent not initialized. Please restart.")
             return
@@ -1004,9 +1200,9 @@ Agenda Path: `{self.agent._agenda_path}`
             # Build contextual prompt based on caption and conversation context
             caption = update.message.caption or self._build_image_context_prompt()
 
-            logger.debug(f"USER: [Image] {caption}")
+            logger.debug("USER: [Image] %s", caption)
 
-            message_time = datetime.now()
+            message_time = _local_time(update.message.date)
             message = Message(
                 id=str(update.message.message_id),
                 timestamp=message_time,
@@ -1022,14 +1218,17 @@ Agenda Path: `{self.agent._agenda_path}`
             )
 
             # Process with persistent typing indicator
-            async with self._typing_indicator(update.message.chat):
+            # Typing shows while queued behind an earlier turn, too
+            async with (
+                self._typing_indicator(update.message.chat),
+                self._inflight,
+                self._dialog_lock,
+            ):
                 response = await self.agent.process(message)
 
-            # Log outgoing response
-            if len(response.content) > 200:
-                logger.debug(f"BOT: {response.content[:200]}...")
-            else:
-                logger.debug(f"BOT: {response.content}")
+            # Log outgoing response (lazy %-args: nothing is formatted unless DEBUG is on)
+            ellipsis = "..." if len(response.content) > 200 else ""
+            logger.debug("BOT: %.200s%s", response.content, ellipsis)
 
             # Reply to the image message
             await self._safe_reply(
@@ -1042,9 +1241,7 @@ Agenda Path: `{self.agent._agenda_path}`
             # Update last message time after successful response
             self._last_message_time = message_time
 
-            cost = response.metadata.get("cost_usd", 0)
-            if cost > 0:
-                logger.debug(f"Request cost: ${cost:.4f}")
+            self._record_cost(response.metadata.get("cost_usd", 0))
 
         except Exception as e:
             logger.error(f"Error handling photo: {e}", exc_info=True)
@@ -1052,45 +1249,47 @@ Agenda Path: `{self.agent._agenda_path}`
 
     async def _handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle incoming text messages."""
-        if not update.effective_user or not self._is_owner(update.effective_user.id):
-            logger.debug(f"Ignoring message from non-owner: {update.effective_user.id}")
-            return
-
-        if not update.message or not update.message.text:
-            return
-
         if not self.agent:
             await update.message.reply_text("Agent not initialized. Please restart.")
             return
 
+        # Whitespace-only text is noise: don't resume, count as activity, or call the LLM
+        text = update.message.text.strip()
+        if not text:
+            return
+
         self._paused = False
 
         # Mark activity for background task scheduling
         self._orchestrator.mark_activity()
 
         # Log incoming message
-        logger.debug(f"USER: {update.message.text}")
+        logger.debug("USER: %s", text)
 
-        message_time = datetime.now()
+        # Telegram's send time: stays accurate even if the update waited for a free slot
+        message_time = _local_time(update.message.date)
         message = Message(
             id=str(update.message.message_id),
             timestamp=message_time,
             role="user",
-            content=update.message.text,
+            content=text,
             content_type=ContentType.TEXT,
             metadata={"telegram_user_id": update.effective_user.id},
         )
 
         try:
             # Process with persistent typing indicator
-            async with self._typing_indicator(update.message.chat):
+            # Typing shows while queued behind an earlier turn, too
+            async with (
+                self._typing_indicator(update.message.chat),
+                self._inflight,
+                self._dialog_lock,
+            ):
                 response = await self.agent.process(message)
 
-            # Log outgoing response
-            if len(response.content) > 200:
-                logger.debug(f"BOT: {response.content[:200]}...")
-            else:
-                logger.debug(f"BOT: {response.content}")
+            # Log outgoing response (lazy %-args: nothing is formatted unless DEBUG is on)
+            ellipsis = "..." if len(response.content) > 200 else ""
+            logger.debug("BOT: %.200s%s", response.content, ellipsis)
 
             # Only quote-reply if message is from earlier context (5+ min gap)
             reply_to = update.message.message_id if self._should_quote_reply(message_time) else None
@@ -1105,9 +1304,7 @@ Agenda Path: `{self.agent._agenda_path}`
             # Update last message time after successful response
             self._last_message_time = message_time
 
-            cost = response.metadata.get("cost_usd", 0)
-            if cost > 0.01:
-                logger.info(f"Response cost: ${cost:.4f}")
+            self._record_cost(response.metadata.get("cost_usd", 0))
 
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
@@ -52,9 +52,12 @@ class SentinelLLMRouter:
         """Get list of available providers (backward compatibility).
 
         Returns non-empty list if any models are configured and available.
+        Providers are unique and keep registry order, so the first entry is
+        the primary provider.
         """
-        available = [m.provider for m in self.registry.models.values() if m.is_available]
-        return list(set(available))  # Unique providers
+        return list(
+            dict.fromkeys(m.provider for m in self.registry.models.values() if m.is_available)
+        )
 
     async def complete(
         self,
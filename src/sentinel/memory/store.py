@@ -101,6 +101,7 @@ class SQLiteMemoryStore(MemoryStore):
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self._conn: aiosqlite.Connection | None = None
+        self._reader: aiosqlite.Connection | None = None  # Read-only, for searches
 
     async def connect(self) -> None:
         """Initialize database connection and schema."""
@@ -109,12 +110,28 @@ class SQLiteMemoryStore(MemoryStore):
         self._conn = await aiosqlite.connect(
             self.db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
         )
+        # WAL lets reads proceed during writes; synchronous=NORMAL skips the per-commit
+        # fsync (a power loss may lose the last commits, but never corrupts the file)
+        await self._conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
+        )
         await self._conn.executescript(SCHEMA)
         await self._conn.commit()
+        # aiosqlite serializes each connection on its own thread, so searches get a second
+        # connection; under WAL they read a snapshot instead of queueing behind writes.
+        # An in-memory database is private to its connection, so it has no reader.
+        if str(self.db_path) != ":memory:":
+            self._reader = await aiosqlite.connect(
+                self.db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+            )
+            await self._reader.execute("PRAGMA query_only=ON")
         logger.info(f"Connected to memory store: {self.db_path}")
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connections."""
+        if self._reader:
+            await self._reader.close()
+            self._reader = None
         if self._conn:
             await self._conn.close()
             self._conn = None
@@ -125,6 +142,11 @@ class SQLiteMemoryStore(MemoryStore):
             raise RuntimeError("Memory store not connected. Call connect() first.")
         return self._conn
 
+    @property
+    def reader(self) -> aiosqlite.Connection:
+        """Connection for read-only queries (the main connection if there is no reader)."""
+        return self._reader or self.conn
+
     # Core memory operations (Letta-inspired self-editing blocks)
 
     async def get_core(self, key: str) -> str | None:
@@ -243,7 +265,7 @@ class SQLiteMemoryStore(MemoryStore):
                 LIMIT ?
             """
 
-            async with self.conn.execute(sql, (escaped_query, limit)) as cursor:
+            async with self.reader.execute(sql, (escaped_query, limit)) as cursor:
                 async for row in cursor:
                     entry_id = row[0]
                     entry_type = MemoryType(row[1])
@@ -272,7 +294,7 @@ class SQLiteMemoryStore(MemoryStore):
         pattern = f"%{query}%"
 
         if memory_type is None or memory_type == MemoryType.EPISODIC:
-            async with self.conn.execute(
+            async with self.reader.execute(
                 "SELECT id, timestamp, summary FROM episodes WHERE summary LIKE ? LIMIT ?",
                 (pattern, limit),
             ) as cursor:
@@ -287,7 +309,7 @@ class SQLiteMemoryStore(MemoryStore):
                     )
 
         if memory_type is None or memory_type == MemoryType.SEMANTIC:
-            async with self.conn.execute(
+            async with self.reader.execute(
                 "SELECT id, created_at, content FROM facts WHERE content LIKE ? LIMIT ?",
                 (pattern, limit),
             ) as cursor:
@@ -306,7 +328,7 @@ class SQLiteMemoryStore(MemoryStore):
     async def get(self, memory_id: str) -> MemoryEntry | None:
         """Get specific memory by ID."""
         # Check episodes
-        async with self.conn.execute(
+        async with self.reader.execute(
             "SELECT id, timestamp, summary, importance, tags, metadata FROM episodes WHERE id = ?",
             (memory_id,),
         ) as cursor:
@@ -323,7 +345,7 @@ class SQLiteMemoryStore(MemoryStore):
                 )
 
         # Check facts
-        async with self.conn.execute(
+        async with self.reader.execute(
             "SELECT id, created_at, content, confidence FROM facts WHERE id = ?",
             (memory_id,),
         ) as cursor:
@@ -366,7 +388,7 @@ class SQLiteMemoryStore(MemoryStore):
     async def get_recent(self, limit: int = 10) -> list[MemoryEntry]:
         """Get most recent memories (fallback when search returns empty)."""
         results = []
-        async with self.conn.execute(
+        async with self.reader.execute(
             "SELECT id, timestamp, summary, importance, tags, metadata FROM episodes "
             "ORDER BY timestamp DESC LIMIT ?",
             (limit,),
@@ -498,6 +520,17 @@ class SQLiteMemoryStore(MemoryStore):
                 )
         return results
 
+    async def get_next_task_run(self) -> datetime | None:
+        """Get the earliest next_run among enabled tasks (None if there are none)."""
+        async with self.conn.execute(
+            "SELECT next_run FROM scheduled_tasks WHERE enabled = 1 ORDER BY next_run LIMIT 1"
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row:
+            return None
+        next_run = row[0]
+        return next_run if isinstance(next_run, datetime) else datetime.fromisoformat(next_run)
+
     async def update_task(self, task_id: str, **fields: Any) -> bool:
         """Update task fields."""
         allowed_fields = ["enabled", "last_run", "next_run", "description"]
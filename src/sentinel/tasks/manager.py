@@ -22,6 +22,7 @@ class TaskManager:
         self,
         memory: SQLiteMemoryStore,
         notification_callback: Callable[[str], Awaitable[None]] | None = None,
+        schedule_callback: Callable[[], Awaitable[None]] | None = None,
     ):
         """
         Initialize task manager.
@@ -29,9 +30,20 @@ class TaskManager:
         Args:
             memory: Memory store for persistence
             notification_callback: Async function to send notifications
+            schedule_callback: Async function called after tasks are added or cancelled
         """
         self.memory = memory
         self.executor = TaskExecutor(notification_callback)
+        self._schedule_callback = schedule_callback
+
+    async def next_due(self) -> datetime | None:
+        """Return when the earliest enabled task is due, or None if nothing is scheduled."""
+        return await self.memory.get_next_task_run()
+
+    async def _schedule_changed(self) -> None:
+        """Let the owner re-arm its due-task timer."""
+        if self._schedule_callback:
+            await self._schedule_callback()
 
     async def add_reminder(self, delay: str, message: str) -> ActionResult:
         """
@@ -62,6 +74,7 @@ class TaskManager:
             )
 
             logger.info(f"Created reminder {task_id}: {message} at {next_run}")
+            await self._schedule_changed()
             return ActionResult(
                 success=True,
                 data={"task_id": task_id, "trigger_at": next_run.isoformat()},
@@ -109,6 +122,7 @@ class TaskManager:
             )
 
             logger.info(f"Created recurring task {task_id}: {description} at {next_run}")
+            await self._schedule_changed()
             return ActionResult(
                 success=True,
                 data={"task_id": task_id, "next_run": next_run.isoformat()},
@@ -154,6 +168,7 @@ class TaskManager:
 
         await self.memory.delete_task(task_id)
         logger.info(f"Cancelled task {task_id}")
+        await self._schedule_changed()
         return ActionResult(success=True, data={"task_id": task_id})
 
     async def check_and_execute_due_tasks(self) -> list[ActionResult]:
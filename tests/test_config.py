@@ -2,6 +2,9 @@
 
 from pathlib import Path
 
+import pytest
+from pydantic import ValidationError
+
 from sentinel.core.config import Settings
 
 
@@ -22,3 +25,9 @@ def test_db_path():
         _env_file=None,
     )
     assert settings.db_path == Path("/tmp/test/test.db")
+
+
+def test_fast_loop_rejects_unknown_value():
+    """A misspelled event loop name fails at load instead of silently falling back."""
+    with pytest.raises(ValidationError):
+        Settings(fast_loop="uv-loop", _env_file=None)
@@ -198,3 +198,34 @@ async def test_dialog_without_tool_calls(memory, mock_llm, tool_registry, conver
 
     # Check LLM was called only once
     assert mock_llm.complete.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_dialog_persists_exchange_in_background(memory, mock_llm, conversation_log):
+    """Exchange persistence runs after the reply and is awaited by flush_pending_writes."""
+    mock_llm.complete.return_value = LLMResponse(
+        content="Hi there.",
+        model="test-model",
+        provider="anthropic",
+        input_tokens=5,
+        output_tokens=5,
+        cost_usd=0.0,
+    )
+    agent = DialogAgent(llm=mock_llm, memory=memory, conversation_log=conversation_log)
+    await agent.initialize()
+
+    user_msg = Message(
+        id="1",
+        timestamp=datetime.now(),
+        role="user",
+        content="Hello",
+        content_type=ContentType.TEXT,
+    )
+    await agent.process(user_msg)
+    assert agent._pending_writes
+
+    await agent.flush_pending_writes()
+
+    assert not agent._pending_writes
+    recent = await memory.get_recent(limit=5)
+    assert any(entry.metadata.get("user_msg_id") == "1" for entry in recent)
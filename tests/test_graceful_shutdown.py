@@ -92,6 +92,7 @@ async def test_stop_summarizes_conversation(tmp_path: Path):
         ),
     ]
     interface.agent.summarize_session = AsyncMock()
+    interface.agent.flush_pending_writes = AsyncMock()
 
     # Mock other components
     interface._orchestrator = Mock()
@@ -105,6 +106,9 @@ async def test_stop_summarizes_conversation(tmp_path: Path):
     interface.app.shutdown = AsyncMock()
     interface.memory = Mock()
     interface.memory.close = AsyncMock()
+    interface._sender_task = None
+    interface._cost_total = 0.0
+    interface._cost_replies = 0
 
     # Call stop
     await interface.stop()
@@ -118,6 +122,7 @@ async def test_stop_summarizes_conversation(tmp_path: Path):
     interface.app.updater.stop.assert_called_once()
     interface.app.stop.assert_called_once()
     interface.app.shutdown.assert_called_once()
+    interface.agent.flush_pending_writes.assert_awaited_once()
     interface.memory.close.assert_called_once()
 
 
@@ -131,6 +136,7 @@ async def test_stop_handles_summarize_failure():
     interface.agent.context = Mock()
     interface.agent.context.conversation = [Mock(), Mock()]
     interface.agent.summarize_session = AsyncMock(side_effect=Exception("Summarize failed"))
+    interface.agent.flush_pending_writes = AsyncMock()
 
     # Mock other components
     interface._orchestrator = Mock()
@@ -139,6 +145,9 @@ async def test_stop_handles_summarize_failure():
     interface.app = None
     interface.memory = Mock()
     interface.memory.close = AsyncMock()
+    interface._sender_task = None
+    interface._cost_total = 0.0
+    interface._cost_replies = 0
 
     # Should not raise exception
     await interface.stop()
@@ -1,5 +1,7 @@
 """Test that HttpAgent is properly registered and chosen for HTTP tasks."""
 
+import pytest
+
 from sentinel.agents.agentic_cli import AgenticCliAgent
 from sentinel.core.tool_agent_registry import ToolAgentRegistry
 from sentinel.tools.decl.curl_agent import config as http_agent_config
@@ -44,3 +46,24 @@ def test_http_vs_file_agent_descriptions():
 
     # They shouldn't overlap too much
     assert http_desc != file_desc
+
+
+def test_capabilities_summary_invalidated_on_register():
+    """Cached capabilities summary picks up newly registered agents."""
+    registry = ToolAgentRegistry()
+    assert registry.get_capabilities_summary() == "(No specialized agents available)"
+
+    registry.register(AgenticCliAgent(config=http_agent_config, llm=None, working_dir="."))
+    summary = registry.get_capabilities_summary()
+    assert "HttpAgent" in summary
+    assert registry.get_capabilities_summary() is summary
+
+    registry.register(AgenticCliAgent(config=file_agent_config, llm=None, working_dir="."))
+    assert "FileAgent" in registry.get_capabilities_summary()
+
+
+def test_register_rejects_non_agent():
+    """Objects missing the agent protocol are rejected."""
+    registry = ToolAgentRegistry()
+    with pytest.raises(ValueError, match="ToolAgentProtocol"):
+        registry.register(object())
@@ -19,6 +19,34 @@ async def memory_store(tmp_path: Path):
     await store.close()
 
 
+@pytest.mark.asyncio
+async def test_connect_enables_wal(memory_store: SQLiteMemoryStore):
+    """Store runs in WAL mode so reads don't block on writes."""
+    async with memory_store.conn.execute("PRAGMA journal_mode") as cursor:
+        row = await cursor.fetchone()
+    assert row[0] == "wal"
+
+
+@pytest.mark.asyncio
+async def test_searches_use_read_only_connection(memory_store: SQLiteMemoryStore):
+    """Reads go through a separate query_only connection that sees committed writes."""
+    assert memory_store.reader is not memory_store.conn
+    async with memory_store.reader.execute("PRAGMA query_only") as cursor:
+        row = await cursor.fetchone()
+    assert row[0] == 1
+
+    entry = MemoryEntry(
+        id="ep-reader",
+        type=MemoryType.EPISODIC,
+        content="Read after write",
+        timestamp=datetime.now(),
+    )
+    await memory_store.store(entry)
+    found = await memory_store.get("ep-reader")
+    assert found is not None
+    assert found.content == "Read after write"
+
+
 @pytest.mark.asyncio
 async def test_core_memory(memory_store: SQLiteMemoryStore):
     """Core memory get/set works."""
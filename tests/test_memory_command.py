@@ -2,10 +2,11 @@
 
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from sentinel.interfaces.telegram import TelegramInterface
+from sentinel.interfaces.telegram import MEMORY_COUNTS_SQL, TelegramInterface
 from sentinel.memory.base import MemoryEntry, MemoryType
 from sentinel.memory.profile import UserProfile
 from sentinel.memory.store import SQLiteMemoryStore
@@ -158,3 +159,45 @@ async def test_memory_command_recent_filter(tmp_path: Path):
     assert recent_memories[0]["content"] == "Recent conversation"
 
     await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_counts_single_query(tmp_path: Path):
+    """Episodic and semantic counts come back from one query."""
+    memory = SQLiteMemoryStore(tmp_path / "test.db")
+    await memory.connect()
+
+    for i in range(3):
+        await memory.store(
+            MemoryEntry(
+                id=f"ep-{i}",
+                type=MemoryType.EPISODIC,
+                content=f"Conversation {i}",
+                timestamp=datetime.now(),
+            )
+        )
+    await memory.store(
+        MemoryEntry(
+            id="fact-0", type=MemoryType.SEMANTIC, content="A fact", timestamp=datetime.now()
+        )
+    )
+
+    async with memory.reader.execute(MEMORY_COUNTS_SQL) as cursor:
+        row = await cursor.fetchone()
+    assert tuple(row) == (3, 1)
+
+    # The handler renders the same counts
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface.memory = memory
+    interface.agent = None
+    interface._safe_reply = AsyncMock()
+    update = Mock()
+    update.effective_chat.id = 1
+
+    await interface._handle_memory(update, None)
+
+    report = interface._safe_reply.await_args.args[1]
+    assert "Episodic: 3 memories" in report
+    assert "Semantic: 1 facts" in report
+
+    await memory.close()
@@ -1,10 +1,15 @@
 """Tests for orchestrator and background agents."""
 
+import asyncio
+import time
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 
+from sentinel.core import orchestrator as orchestrator_module
 from sentinel.core.orchestrator import Orchestrator, ScheduledTask, TaskPriority
+from sentinel.core.types import AgentType
 
 
 @pytest.fixture
@@ -30,6 +35,19 @@ def test_schedule_task(orchestrator):
     assert orchestrator._tasks["test"].name == "Test task"
 
 
+def test_schedule_task_detects_async_callback(orchestrator):
+    """Async callbacks are flagged once at schedule time."""
+
+    async def async_cb():
+        pass
+
+    orchestrator.schedule_task("async", "Async", async_cb)
+    orchestrator.schedule_task("sync", "Sync", lambda: None)
+
+    assert orchestrator._tasks["async"].is_coro
+    assert not orchestrator._tasks["sync"].is_coro
+
+
 def test_cancel_task(orchestrator):
     """Test task cancellation."""
     orchestrator.schedule_task(
@@ -41,6 +59,44 @@ def test_cancel_task(orchestrator):
     assert "test" not in orchestrator._tasks
 
 
+def test_pop_due_orders_by_priority(orchestrator):
+    """Only due tasks are popped, highest priority first."""
+    orchestrator.schedule_task("low", "Low", lambda: None, priority=TaskPriority.LOW)
+    orchestrator.schedule_task("high", "High", lambda: None, priority=TaskPriority.HIGH)
+    orchestrator.schedule_task("later", "Later", lambda: None, delay=timedelta(hours=1))
+
+    due = orchestrator._pop_due(time.monotonic())
+
+    assert [t.id for t in due] == ["high", "low"]
+    assert orchestrator._pop_due(time.monotonic()) == []
+
+
+def test_pop_due_skips_cancelled_and_rescheduled(orchestrator):
+    """Stale heap entries are dropped lazily."""
+    orchestrator.schedule_task("gone", "Gone", lambda: None)
+    orchestrator.cancel_task("gone")
+    orchestrator.schedule_task("moved", "Moved", lambda: None)
+    orchestrator.schedule_task("moved", "Moved", lambda: None, delay=timedelta(hours=1))
+
+    assert orchestrator._pop_due(time.monotonic()) == []
+
+
+def test_get_agent_by_type(orchestrator):
+    """Type index tracks register/unregister, preferring the first registered agent."""
+    first = SimpleNamespace(config=SimpleNamespace(agent_type=AgentType.SLEEP))
+    second = SimpleNamespace(config=SimpleNamespace(agent_type=AgentType.SLEEP))
+    orchestrator.register_agent("a", first)
+    orchestrator.register_agent("b", second)
+
+    assert orchestrator.get_agent(AgentType.SLEEP) is first
+    assert orchestrator.get_agent(AgentType.DIALOG) is None
+
+    orchestrator.unregister_agent("a")
+    assert orchestrator.get_agent(AgentType.SLEEP) is second
+    orchestrator.unregister_agent("b")
+    assert orchestrator.get_agent(AgentType.SLEEP) is None
+
+
 def test_mark_activity(orchestrator):
     """Test activity marking."""
     old_activity = orchestrator._last_activity
@@ -55,7 +111,7 @@ def test_idle_detection(orchestrator):
     assert not orchestrator.is_idle()
 
     # Simulate old activity
-    orchestrator._last_activity = datetime.now() - timedelta(minutes=10)
+    orchestrator._last_activity = time.monotonic() - 600
     assert orchestrator.is_idle()
 
 
@@ -94,3 +150,68 @@ async def test_orchestrator_start_stop():
     assert orch._running
     await orch.stop()
     assert not orch._running
+
+
+async def test_scheduler_wakes_on_new_task():
+    """Tasks scheduled on a running orchestrator fire without waiting for a poll tick."""
+    orch = Orchestrator()
+    await orch.start()
+    fired = asyncio.Event()
+    try:
+        await asyncio.sleep(0)  # let the loop park on the empty schedule
+        orch.schedule_task(task_id="now", name="Now", callback=fired.set)
+        await asyncio.wait_for(fired.wait(), timeout=0.5)
+    finally:
+        await orch.stop()
+    assert "now" not in orch._tasks
+
+
+async def test_same_priority_tasks_run_concurrently():
+    """Due tasks sharing a priority are awaited together, not one after another."""
+    orch = Orchestrator()
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def blocking(name: str) -> None:
+        started.append(name)
+        await release.wait()
+
+    orch.schedule_task("a", "A", lambda: blocking("a"))
+    orch.schedule_task("b", "B", lambda: blocking("b"))
+    await orch.start()
+    try:
+        for _ in range(10):
+            if len(started) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert sorted(started) == ["a", "b"]
+    finally:
+        release.set()
+        await orch.stop()
+
+
+async def test_sync_callback_return_value_ignored(orchestrator, monkeypatch):
+    """A sync callback returning a non-awaitable value is not treated as a failure."""
+    errors: list[str] = []
+    monkeypatch.setattr(orchestrator_module.logger, "error", lambda msg, **_: errors.append(msg))
+    orchestrator.schedule_task("truthy", "Truthy", lambda: True)
+
+    await orchestrator._run_task(orchestrator._tasks["truthy"])
+
+    assert errors == []
+    assert "truthy" not in orchestrator._tasks
+
+
+def test_disabled_one_shot_runs_after_reenable(orchestrator):
+    """A disabled one-shot task stays scheduled and fires once re-enabled."""
+    orchestrator.schedule_task("once", "Once", lambda: None)
+    task = orchestrator._tasks["once"]
+    task.enabled = False
+    now = time.monotonic()
+
+    assert orchestrator._pop_due(now) == []
+    assert "once" in orchestrator._tasks
+
+    task.enabled = True
+    assert orchestrator._pop_due(now) == []
+    assert orchestrator._pop_due(task.next_run) == [task]
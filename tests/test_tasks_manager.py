@@ -155,6 +155,29 @@ async def test_cancel_task(task_manager):
     assert len(tasks) == 0
 
 
+@pytest.mark.asyncio
+async def test_next_due_and_schedule_callback(memory):
+    """Adding/cancelling tasks notifies the owner; next_due tracks the earliest task."""
+    calls = []
+
+    async def on_change():
+        calls.append(await manager.next_due())
+
+    manager = TaskManager(memory=memory, schedule_callback=on_change)
+    assert await manager.next_due() is None
+
+    later = await manager.add_reminder("2h", "later")
+    soon = await manager.add_reminder("5m", "soon")
+    assert len(calls) == 2
+    assert calls[1] == datetime.fromisoformat(soon.data["trigger_at"])
+
+    await manager.cancel_task(soon.data["task_id"])
+    assert calls[2] == datetime.fromisoformat(later.data["trigger_at"])
+
+    await manager.cancel_task(later.data["task_id"])
+    assert calls[3] is None
+
+
 @pytest.mark.asyncio
 async def test_invalid_delay(task_manager):
     """Test invalid delay format."""
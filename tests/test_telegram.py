@@ -1,10 +1,19 @@
 """Tests for Telegram interface."""
 
-from datetime import datetime, timedelta
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from sentinel.interfaces.telegram import TelegramInterface
+from sentinel.interfaces.telegram import (
+    TRUNCATED_SUFFIX,
+    TelegramInterface,
+    _local_time,
+    _truncate_for_telegram,
+)
 
 
 def test_split_message_short():
@@ -45,6 +54,248 @@ def test_split_message_at_space():
     assert not chunks[0].endswith("wor")
 
 
+def test_split_message_many_chunks_roundtrip():
+    """Long text splits into bounded chunks that rejoin to the original."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    text = ("line of text " * 30 + "\n") * 100  # ~39k chars
+    chunks = interface._split_message(text, 4000)
+    assert len(chunks) > 9
+    assert all(len(chunk) <= 4000 for chunk in chunks)
+    assert "".join(chunks) == text
+
+
+def test_truncate_for_telegram_short_text_unchanged():
+    """Text within the limit is returned as is."""
+    assert _truncate_for_telegram("A" * 4096) == "A" * 4096
+
+
+def test_truncate_for_telegram_counts_utf16_units():
+    """Emoji count as two UTF-16 units; result fits and never splits a pair."""
+    text = "😀" * 3000  # 3000 code points, 6000 UTF-16 units
+    result = _truncate_for_telegram(text)
+
+    assert result.endswith(TRUNCATED_SUFFIX)
+    assert len(result.encode("utf-16-le")) // 2 <= 4096
+    assert set(result.removesuffix(TRUNCATED_SUFFIX)) == {"😀"}
+
+
+async def test_safe_reply_plain_text_skips_markdown():
+    """Text without markdown tokens is sent once, without parse_mode."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._bot = Mock()
+    interface._bot.send_message = AsyncMock()
+
+    await interface._safe_reply(1, "Just a plain answer.", is_markdown=True)
+
+    interface._bot.send_message.assert_awaited_once_with(
+        chat_id=1, text="Just a plain answer.", reply_to_message_id=None
+    )
+
+
+async def test_send_chunk_plain_failure_is_not_retried():
+    """A failed plain send is logged, not repeated with the same payload."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    bot = Mock()
+    bot.send_message = AsyncMock(side_effect=RuntimeError("boom"))
+
+    await interface._send_chunk(bot, 1, "hello", is_markdown=False, reply_to=None)
+
+    bot.send_message.assert_awaited_once()
+
+
+async def test_send_chunk_markdown_failure_falls_back_to_plain():
+    """A rejected MarkdownV2 send is retried once without parse_mode."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    bot = Mock()
+    bot.send_message = AsyncMock(side_effect=[RuntimeError("can't parse entities"), None])
+
+    await interface._send_chunk(bot, 1, "*hi*", is_markdown=True, reply_to=None)
+
+    assert bot.send_message.await_count == 2
+    assert "parse_mode" not in bot.send_message.await_args.kwargs
+
+
+async def test_notifications_are_queued_and_delivered_in_order():
+    """Notifications return immediately; the sender task delivers them in order."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface.owner_id = 1
+    interface._outbox = asyncio.Queue(maxsize=256)
+    interface._safe_reply = AsyncMock()
+
+    await interface._send_notification("first")
+    await interface._send_notification("second")
+    interface._safe_reply.assert_not_awaited()
+
+    sender = asyncio.create_task(interface._sender_loop())
+    await asyncio.wait_for(interface._outbox.join(), timeout=1.0)
+    sender.cancel()
+
+    sent = [call.args[1] for call in interface._safe_reply.await_args_list]
+    assert sent == ["🔔 first", "🔔 second"]
+
+
+async def test_dispatch_command_routes_by_name():
+    """Commands are routed by name, ignoring case, bot mention and arguments."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    status = AsyncMock()
+    interface._commands = {"status": status}
+    update = Mock()
+    update.message.text = "/Status@SentinelBot now"
+
+    await interface._dispatch_command(update, None)
+
+    status.assert_awaited_once_with(update, None)
+
+
+def test_record_cost_logs_batched_total(caplog):
+    """Costs are summed and logged once per batch, then reset."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._cost_total = 0.0
+    interface._cost_replies = 0
+
+    with caplog.at_level(logging.INFO, logger="sentinel.interfaces.telegram"):
+        for _ in range(9):
+            interface._record_cost(0.01)
+        assert "Reply cost" not in caplog.text
+        interface._record_cost(0.01)
+
+    assert "Reply cost: $0.1000 over 10 replies" in caplog.text
+    assert interface._cost_replies == 0
+    assert interface._cost_total == 0.0
+
+
+def test_stop_logs_remaining_cost(caplog):
+    """A partial batch is logged by _flush_cost_log (called from stop())."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._cost_total = 0.0
+    interface._cost_replies = 0
+
+    with caplog.at_level(logging.INFO, logger="sentinel.interfaces.telegram"):
+        interface._record_cost(0.002)
+        assert "Reply cost" not in caplog.text
+        interface._flush_cost_log()
+        interface._flush_cost_log()
+
+    assert caplog.text.count("Reply cost: $0.0020 over 1 replies") == 1
+
+
+@pytest.mark.parametrize(
+    ("time_token", "accepted"),
+    [("9am", True), ("09:30", True), ("6PM", True), ("1830", True), ("news", False)],
+)
+async def test_schedule_time_token(time_token, accepted):
+    """/schedule accepts the time formats ScheduleParser understands."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._task_manager = Mock()
+    interface._task_manager.add_recurring_task = AsyncMock(
+        return_value=Mock(success=True, data={"task_id": "t1", "next_run": ""})
+    )
+    update = Mock()
+    update.message.reply_text = AsyncMock()
+    context = Mock(args=["daily", time_token, "check", "news"])
+
+    await interface._handle_schedule(update, context)
+
+    if accepted:
+        kwargs = interface._task_manager.add_recurring_task.await_args.kwargs
+        assert kwargs["schedule"] == f"daily {time_token}"
+        assert kwargs["description"] == "check news"
+    else:
+        interface._task_manager.add_recurring_task.assert_not_awaited()
+
+
+async def test_handle_tasks_lists_entries():
+    """/tasks renders one block per task under a header."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._task_manager = Mock()
+    interface._task_manager.list_tasks = AsyncMock(
+        return_value=[
+            {
+                "id": "a1",
+                "schedule_type": "once",
+                "description": "call mom",
+                "next_run": "2026-01-01T09:00:00",
+            },
+            {
+                "id": "b2",
+                "schedule_type": "recurring",
+                "description": "news",
+                "next_run": "2026-01-02T09:00:00.123",
+            },
+        ]
+    )
+    interface._safe_reply = AsyncMock()
+    update = Mock()
+    update.effective_chat.id = 1
+
+    await interface._handle_tasks(update, Mock())
+
+    interface._safe_reply.assert_awaited_once_with(
+        1,
+        "*Active Tasks*\n\n"
+        "`a1` [once] call mom\n  Next: 2026-01-01T09:00\n\n"
+        "`b2` [recurring] news\n  Next: 2026-01-02T09:00\n",
+    )
+
+
+async def test_handle_agenda_reuses_truncation_until_agenda_changes(monkeypatch):
+    """The truncated /agenda reply is recomputed only when the agenda text changes."""
+    import sentinel.interfaces.telegram as telegram_module
+
+    calls = []
+
+    def fake_truncate(text):
+        calls.append(text)
+        return text.upper()
+
+    monkeypatch.setattr(telegram_module, "_truncate_for_telegram", fake_truncate)
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._agenda_reply = ("", "")
+    interface.agent = Mock(_agenda="plan")
+    interface._safe_reply = AsyncMock()
+    update = Mock()
+    update.effective_chat.id = 1
+
+    await interface._handle_agenda(update, None)
+    await interface._handle_agenda(update, None)
+    interface.agent._agenda = "new plan"
+    await interface._handle_agenda(update, None)
+
+    assert calls == ["plan", "new plan"]
+    assert interface._safe_reply.await_args.args == (1, "NEW PLAN")
+
+
+async def test_handle_message_ignores_whitespace_only_text():
+    """Whitespace-only messages never reach the agent or count as activity."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface.agent = Mock()
+    interface.agent.process = AsyncMock()
+    interface._orchestrator = Mock()
+    interface._paused = True
+    update = Mock()
+    update.message.text = "  \n\t "
+
+    await interface._handle_message(update, None)
+
+    interface.agent.process.assert_not_awaited()
+    interface._orchestrator.mark_activity.assert_not_called()
+    assert interface._paused
+
+
+def test_local_time_converts_telegram_date():
+    """Telegram's aware UTC date becomes a naive local time for the same instant."""
+    sent_at = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    local = _local_time(sent_at)
+    assert local.tzinfo is None
+    assert local.astimezone() == sent_at
+
+
+def test_local_time_without_date_uses_now():
+    """A message without a date falls back to the current local time."""
+    before = datetime.now()
+    assert before <= _local_time(None) <= datetime.now()
+
+
 def test_should_quote_reply_first_message():
     """First message should not quote-reply."""
     interface = TelegramInterface.__new__(TelegramInterface)
@@ -130,3 +381,238 @@ async def test_typing_indicator_cancels_on_error():
     await asyncio.sleep(0.1)
 
     # Should not raise any errors - context manager handled cleanup
+
+
+@pytest.mark.asyncio
+async def test_typing_indicator_ignores_send_failures():
+    """A failing typing action should not propagate into the wrapped operation."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    chat = Mock()
+    chat.send_action = AsyncMock(side_effect=RuntimeError("network down"))
+
+    async with interface._typing_indicator(chat):
+        await asyncio.sleep(0.01)
+
+    chat.send_action.assert_awaited()
+
+
+def test_rate_limiter_disabled_by_default():
+    """Sends are unpaced unless SENTINEL_TELEGRAM_RATE_LIMIT is set."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._settings = Mock(telegram_rate_limit=False)
+    assert interface._build_rate_limiter() is None
+
+
+async def test_start_updates_uses_long_polling_without_webhook():
+    """Without a webhook URL, updates come from long polling limited to messages."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._settings = Mock(telegram_webhook_url="")
+    interface.app = Mock()
+    interface.app.updater.start_polling = AsyncMock()
+    interface.app.updater.start_webhook = AsyncMock()
+
+    await interface._start_updates()
+
+    interface.app.updater.start_webhook.assert_not_awaited()
+    kwargs = interface.app.updater.start_polling.await_args.kwargs
+    assert kwargs["allowed_updates"] == ["message"]
+    assert kwargs["bootstrap_retries"] >= 0
+
+
+async def test_start_updates_webhook_always_sets_secret():
+    """Webhook mode generates a secret token when none is configured."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._settings = Mock(
+        telegram_webhook_url="https://bot.example.com/",
+        telegram_webhook_listen="0.0.0.0",
+        telegram_webhook_port=8443,
+        telegram_webhook_secret="",
+    )
+    interface.app = Mock()
+    interface.app.updater.start_webhook = AsyncMock()
+
+    await interface._start_updates()
+
+    kwargs = interface.app.updater.start_webhook.await_args.kwargs
+    assert kwargs["webhook_url"] == "https://bot.example.com/telegram"
+    assert len(kwargs["secret_token"]) >= 32
+    assert kwargs["bootstrap_retries"] >= 0
+
+
+async def test_dialog_turns_are_serialized():
+    """Concurrent text messages are processed one turn at a time."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._dialog_lock = asyncio.Lock()
+    interface._inflight = asyncio.Semaphore(4)
+    interface._orchestrator = Mock()
+    interface._last_message_time = None
+    interface._cost_total = 0.0
+    interface._cost_replies = 0
+    interface._safe_reply = AsyncMock()
+
+    active = 0
+    peak = 0
+
+    async def process(message):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Mock(content="ok", metadata={})
+
+    interface.agent = Mock()
+    interface.agent.process = process
+
+    def make_update(text):
+        update = Mock()
+        update.message.text = text
+        update.message.date = None
+        update.message.chat.send_action = AsyncMock()
+        return update
+
+    await asyncio.gather(
+        interface._handle_message(make_update("one"), None),
+        interface._handle_message(make_update("two"), None),
+    )
+
+    assert peak == 1
+    assert interface._safe_reply.await_count == 2
+
+
+async def test_code_runs_share_inflight_limit():
+    """/code and dialog turns draw from the same in-flight budget."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._dialog_lock = asyncio.Lock()
+    interface._inflight = asyncio.Semaphore(1)
+    interface._orchestrator = Mock()
+    interface._last_message_time = None
+    interface._cost_total = 0.0
+    interface._cost_replies = 0
+    interface._safe_reply = AsyncMock()
+
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def dialog_process(message):
+        order.append("dialog")
+        await release.wait()
+        return Mock(content="ok", metadata={})
+
+    async def code_process(message):
+        order.append("code")
+        return Mock(content="done")
+
+    interface.agent = Mock()
+    interface.agent.process = dialog_process
+    interface._code_agent = Mock()
+    interface._code_agent.process = code_process
+
+    def make_update(text):
+        update = Mock()
+        update.message.text = text
+        update.message.date = None
+        update.message.chat.send_action = AsyncMock()
+        return update
+
+    dialog = asyncio.create_task(interface._handle_message(make_update("hi"), None))
+    code = asyncio.create_task(
+        interface._handle_code(make_update("/code x"), Mock(args=["print(1)"]))
+    )
+    await asyncio.sleep(0.01)
+    assert order == ["dialog"]
+
+    release.set()
+    await asyncio.gather(dialog, code)
+    assert order == ["dialog", "code"]
+
+
+async def test_clear_waits_for_in_flight_turn():
+    """/clear runs after the current dialog turn, so its reply isn't orphaned."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._dialog_lock = asyncio.Lock()
+    interface.agent = Mock()
+    interface.agent.context.conversation = ["user", "assistant"]
+    interface.agent.summarize_session = AsyncMock(return_value="")
+    update = Mock()
+    update.message.reply_text = AsyncMock()
+
+    async with interface._dialog_lock:
+        clear = asyncio.create_task(interface._handle_clear(update, None))
+        await asyncio.sleep(0.01)
+        assert not clear.done()
+        interface.agent.context.conversation.append("late reply")
+
+    await clear
+    interface.agent.summarize_session.assert_awaited_once()
+    assert interface.agent.context.conversation == []
+
+
+async def test_stop_flushes_pending_writes_before_closing_memory():
+    """Exchanges still persisting in the background land before memory closes."""
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._orchestrator = Mock(stop=AsyncMock())
+    interface._router = None
+    interface._sender_task = None
+    interface.app = Mock()
+    interface.app.updater.stop = AsyncMock()
+    interface.app.stop = AsyncMock()
+    interface.app.shutdown = AsyncMock()
+
+    events: list[str] = []
+
+    async def persist():
+        await asyncio.sleep(0.01)
+        events.append("write")
+
+    pending = asyncio.create_task(persist())
+
+    async def flush_pending_writes():
+        await pending
+
+    interface.agent = Mock()
+    interface.agent.context.conversation = []
+    interface.agent.flush_pending_writes = flush_pending_writes
+    interface.memory = Mock()
+    interface._cost_total = 0.0
+    interface._cost_replies = 0
+    interface.memory.close = AsyncMock(side_effect=lambda: events.append("close"))
+
+    await interface.stop()
+
+    assert events == ["write", "close"]
+
+
+async def test_due_tasks_rearmed_with_backoff_after_failure():
+    """A failed due-task run re-arms the timer after a back-off instead of retiring it."""
+    from sentinel.core.orchestrator import Orchestrator
+    from sentinel.interfaces.telegram import DUE_TASKS_RETRY_DELAY
+
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._orchestrator = Orchestrator()
+    interface._task_manager = Mock()
+    interface._task_manager.check_and_execute_due_tasks = AsyncMock(
+        side_effect=RuntimeError("database is locked")
+    )
+    interface._task_manager.next_due = AsyncMock(return_value=datetime.now())
+
+    with pytest.raises(RuntimeError):
+        await interface._run_due_tasks()
+
+    task = interface._orchestrator._tasks["due_tasks"]
+    assert task.next_run - time.monotonic() > DUE_TASKS_RETRY_DELAY - 1
+
+
+async def test_awareness_check_rearms_due_tasks():
+    """The periodic awareness check re-arms a lost due-task timer."""
+    from sentinel.core.orchestrator import Orchestrator
+
+    interface = TelegramInterface.__new__(TelegramInterface)
+    interface._orchestrator = Orchestrator()
+    interface._awareness_agent = None
+    interface._task_manager = Mock()
+    interface._task_manager.next_due = AsyncMock(return_value=datetime.now() + timedelta(hours=1))
+
+    await interface._run_awareness_check()
+
+    assert "due_tasks" in interface._orchestrator._tasks
@@ -26,3 +26,36 @@ def test_message_default_content_type():
         content="Hi there",
     )
     assert msg.content_type == ContentType.TEXT
+
+
+def test_message_to_llm_format_with_images():
+    """Image metadata yields text + image content blocks."""
+    msg = Message(
+        id="test-3",
+        timestamp=datetime.now(),
+        role="user",
+        content="Look",
+        content_type=ContentType.IMAGE,
+        metadata={"images": [{"data": "abc"}]},
+    )
+    result = msg.to_llm_format()
+    assert result["content"] == [
+        {"type": "text", "text": "Look"},
+        {
+            "type": "image",
+            "source": {"type": "base64", "media_type": "image/jpeg", "data": "abc"},
+        },
+    ]
+
+
+def test_message_to_llm_format_non_list_images_is_text():
+    """Malformed image metadata falls back to plain text."""
+    msg = Message(
+        id="test-4",
+        timestamp=datetime.now(),
+        role="user",
+        content="Hi",
+        content_type=ContentType.IMAGE,
+        metadata={"images": None},
+    )
+    assert msg.to_llm_format() == {"role": "user", "content": "Hi"}
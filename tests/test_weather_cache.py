@@ -0,0 +1,53 @@
+"""Tests for WeatherAgent location-keyed summary cache."""
+
+from unittest.mock import AsyncMock
+
+from sentinel.agents.tool_agents import weather
+from sentinel.agents.tool_agents.weather import WeatherAgent
+
+
+def _agent() -> WeatherAgent:
+    agent = WeatherAgent(llm=None)
+    agent._fetch_weather = AsyncMock(return_value={})
+    agent._summarize_weather = AsyncMock(return_value="Sunny, 20°C")
+    return agent
+
+
+async def test_paraphrased_requests_hit_cache():
+    """Requests resolving to the same location reuse the cached summary."""
+    agent = _agent()
+    agent._extract_location = AsyncMock(side_effect=["Tokyo", " tokyo "])
+
+    first = await agent.execute_task("weather in Tokyo", {})
+    second = await agent.execute_task("will it rain in Tokyo", {})
+
+    assert first == second == "Sunny, 20°C"
+    assert agent._fetch_weather.await_count == 1
+    assert agent._summarize_weather.await_count == 1
+
+
+async def test_expired_entry_refetches(monkeypatch):
+    """Entries older than the TTL are dropped."""
+    agent = _agent()
+    agent._extract_location = AsyncMock(return_value="London")
+
+    await agent.execute_task("weather in London", {})
+    monkeypatch.setattr(weather, "CACHE_TTL_SECONDS", -1.0)
+    await agent.execute_task("weather in London", {})
+
+    assert agent._fetch_weather.await_count == 2
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    """Cache is capped, evicting the oldest unused entry."""
+    monkeypatch.setattr(weather, "CACHE_MAX_ENTRIES", 2)
+    agent = _agent()
+
+    agent._cache_put("a", "A")
+    agent._cache_put("b", "B")
+    assert agent._cache_get("a") == "A"  # refresh "a"
+    agent._cache_put("c", "C")
+
+    assert agent._cache_get("b") is None
+    assert agent._cache_get("a") == "A"
+    assert agent._cache_get("c") == "C"